@@ -6,11 +6,15 @@ import argparse
 import csv
 import json
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any, Sequence
 
-from pipeflow.config import load_config
-from pipeflow.pipeline import Pipeline
+from pipeflow.lib.jsonlib import load_path, loads
+
+# pipeflow.config and pipeflow.pipeline pull in yaml and pydantic; they are
+# imported inside the commands that need them so `inspect` and `--help` stay
+# fast to start.
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -24,6 +28,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     # run command
     run_parser = subparsers.add_parser("run", help="Execute a pipeline from a YAML config")
     run_parser.add_argument("config", help="Path to pipeline YAML config file")
+    run_parser.add_argument(
+        "--reuse-records",
+        action="store_true",
+        help="Let transforms update records in place instead of copying them",
+    )
 
     # validate command
     validate_parser = subparsers.add_parser("validate", help="Validate a pipeline config")
@@ -44,7 +53,7 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     match args.command:
         case "run":
-            return _cmd_run(args.config)
+            return _cmd_run(args.config, args.reuse_records)
         case "validate":
             return _cmd_validate(args.config)
         case "inspect":
@@ -54,13 +63,18 @@ def main(argv: Sequence[str] | None = None) -> int:
             return 1
 
 
-def _cmd_run(config_path: str) -> int:
+def _cmd_run(config_path: str, reuse_records: bool = False) -> int:
     """Execute a pipeline."""
+    from pipeflow.config import load_config
+    from pipeflow.pipeline import Pipeline
+
     try:
         config = load_config(config_path)
     except (FileNotFoundError, ValueError) as e:
         print(f"Error loading config: {e}", file=sys.stderr)
         return 1
+    if reuse_records:
+        config.reuse_records = True
 
     try:
         pipeline = Pipeline(config)
@@ -74,6 +88,8 @@ def _cmd_run(config_path: str) -> int:
 
 def _cmd_validate(config_path: str) -> int:
     """Validate a pipeline config file."""
+    from pipeflow.config import load_config
+
     try:
         config = load_config(config_path)
         print(f"✓ Config '{config.name}' is valid")
@@ -111,18 +127,39 @@ def _cmd_inspect(file_path: str, num_rows: int) -> int:
         return 1
 
 
+def _count_lines(path: Path) -> int:
+    """Count lines by scanning raw bytes for newlines in 1 MiB blocks.
+
+    A trailing line without a final newline is counted as well.
+    """
+    count = 0
+    last = b""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block
+    if last and not last.endswith(b"\n"):
+        count += 1
+    return count
+
+
 def _inspect_csv(path: Path, num_rows: int) -> int:
     with open(path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = []
-        for i, row in enumerate(reader):
-            rows.append(dict(row))
-            if i + 1 >= num_rows:
-                break
-        # Count remaining
-        count = len(rows)
-        for _ in reader:
-            count += 1
+        # Quoted fields may hide newlines, which breaks the raw newline count;
+        # only files that use quotes near the top pay for a full csv parse.
+        quoted = '"' in f.read(1 << 16)
+        f.seek(0)
+        reader = csv.reader(f)
+        fieldnames = next(reader, None) or []
+        data_rows = (row for row in reader if row)
+        rows = [dict(zip(fieldnames, row)) for row in islice(data_rows, num_rows)]
+        if quoted:
+            count = len(rows) + sum(1 for _ in data_rows)
+
+    if not quoted:
+        # Blank lines make the raw count an over-estimate, as do quoted
+        # newlines further down than the sniffed block.
+        count = max(_count_lines(path) - 1, len(rows))
 
     if not rows:
         print(f"File: {path}")
@@ -132,7 +169,6 @@ def _inspect_csv(path: Path, num_rows: int) -> int:
         print("\nFile is empty — no data rows found.")
         return 0
 
-    fieldnames = list(rows[0].keys())
     print(f"File: {path}")
     print("Format: CSV")
     print(f"Columns: {fieldnames}")
@@ -144,23 +180,28 @@ def _inspect_csv(path: Path, num_rows: int) -> int:
 
 
 def _inspect_json(path: Path, num_rows: int, jsonl: bool) -> int:
-    records: list[dict[str, Any]] = []
+    sample: list[dict[str, Any]] = []
+    total = 0
     if jsonl:
-        with open(path, "r", encoding="utf-8") as f:
+        # Only the sample lines are decoded; the rest are just counted.
+        with open(path, "rb") as f:
             for line in f:
-                line = line.strip()
-                if line:
-                    records.append(json.loads(line))
+                if not line.strip():
+                    continue
+                total += 1
+                if len(sample) < num_rows:
+                    sample.append(loads(line))
     else:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_path(path)
+        records: list[dict[str, Any]] = []
         if isinstance(data, list):
             records = data
         elif isinstance(data, dict):
             records = [data]
+        sample = records[:num_rows]
+        total = len(records)
 
-    fieldnames = list(records[0].keys()) if records else []
-    if not records:
+    if not total:
         print(f"File: {path}")
         print(f"Format: {'JSONL' if jsonl else 'JSON'}")
         print("Fields: []")
@@ -168,11 +209,12 @@ def _inspect_json(path: Path, num_rows: int, jsonl: bool) -> int:
         print("\nFile is empty — no records found.")
         return 0
 
+    fieldnames = list(sample[0].keys()) if sample else []
     print(f"File: {path}")
     print(f"Format: {'JSONL' if jsonl else 'JSON'}")
     print(f"Fields: {fieldnames}")
-    print(f"Total records: {len(records)}")
-    print(f"\nSample ({min(num_rows, len(records))} records):")
-    for rec in records[:num_rows]:
+    print(f"Total records: {total}")
+    print(f"\nSample ({len(sample)} records):")
+    for rec in sample:
         print(f"  {rec}")
     return 0
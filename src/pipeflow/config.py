@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+# Prefer the libyaml-backed loader; fall back to pure Python when PyYAML was
+# built without libyaml.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# First bytes of lines that cannot start a top-level mapping key.
+_NOT_A_KEY = frozenset({b"", b" ", b"\t", b"#", b"-", b"\n", b"\r"})
+
 
 class ExtractConfig(BaseModel):
     """Configuration for the extraction step."""
@@ -17,9 +25,11 @@ class ExtractConfig(BaseModel):
     url: str | None = None
     delimiter: str = ","
     encoding: str = "utf-8"
+    engine: str = "stdlib"
     headers: dict[str, str] = Field(default_factory=dict)
     params: dict[str, str] = Field(default_factory=dict)
     pagination: dict[str, Any] | None = None
+    keep_alive: bool = False
 
 
 class TransformConfig(BaseModel):
@@ -31,6 +41,8 @@ class TransformConfig(BaseModel):
     condition: str | None = None
     expression: str | None = None
     key: str | list[str] | None = None
+    in_place: bool = False
+    hashed: bool = False
 
 
 class ValidateConfig(BaseModel):
@@ -38,6 +50,7 @@ class ValidateConfig(BaseModel):
 
     model: str
     fields: dict[str, dict[str, Any]] | None = None
+    max_errors: int = Field(default=1000, ge=0)
 
 
 class LoadConfig(BaseModel):
@@ -49,7 +62,11 @@ class LoadConfig(BaseModel):
     path: str | None = None
     mode: str = "insert"
     conflict_key: str | None = None
-    batch_size: int = 100
+    batch_size: int = Field(default=100, gt=0)
+    wal: bool = True
+    pre_serialized: bool = False
+    commit_every: int = 10
+    background: bool = False
 
 
 class PipelineConfig(BaseModel):
@@ -60,20 +77,86 @@ class PipelineConfig(BaseModel):
     transforms: list[TransformConfig] = Field(default_factory=list)
     validate: ValidateConfig | None = Field(default=None, alias="validate")  # type: ignore[assignment]
     load: LoadConfig
+    reuse_records: bool = False
 
     model_config = {"populate_by_name": True}
 
 
+# Parsed configs keyed by (resolved path, mtime_ns, size); an edited file
+# gets a new key and is parsed again.  Insertion order doubles as LRU order.
+_CACHE: dict[tuple[str, int, int], PipelineConfig] = {}
+_CACHE_SIZE = 128
+
+
 def load_config(path: str | Path) -> PipelineConfig:
-    """Load and validate a pipeline config from a YAML file."""
+    """Load and validate a pipeline config from a YAML file.
+
+    Parses are memoized per file version; each call returns its own deep
+    copy of the cached ``PipelineConfig``, so callers may modify it freely.
+    """
+    config_path = Path(path)
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _CACHE.pop(key, None)
+    if cached is None:
+        cached = _parse_config(config_path)
+        if len(_CACHE) >= _CACHE_SIZE:
+            del _CACHE[next(iter(_CACHE))]
+    _CACHE[key] = cached
+    return cached.model_copy(deep=True)
+
+
+def clear_config_cache() -> None:
+    """Forget all memoized configs."""
+    _CACHE.clear()
+
+
+def load_config_header(path: str | Path, max_lines: int = 64) -> dict[str, Any]:
+    """Parse just the top of a config file, for cheap lookups like ``name``.
+
+    Reads at most *max_lines* lines and drops a trailing top-level section
+    that may have been cut off, so sections that fit are returned whole and
+    later ones (typically ``transforms``) are simply absent.  The result is
+    the raw, unvalidated mapping; use ``load_config`` for a ``PipelineConfig``.
+    Falls back to parsing the whole file if a truncated prefix is not valid
+    YAML; a file read in full raises its parse error as ``load_config`` does.
+    """
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        lines = list(islice(f, max_lines + 1))
+        truncated = len(lines) > max_lines
+        if truncated:
+            starts = [i for i, line in enumerate(lines) if line[:1] not in _NOT_A_KEY]
+            lines = lines[: starts[-1]] if starts else []
+        try:
+            raw = yaml.load(b"".join(lines), Loader=_Loader)
+        except yaml.YAMLError:
+            if not truncated:
+                raise
+            raw = None
+        if truncated and not isinstance(raw, dict):
+            f.seek(0)
+            raw = yaml.load(f, Loader=_Loader)
 
+    return _require_mapping(raw)
+
+
+def _parse_config(config_path: Path) -> PipelineConfig:
+    # libyaml reads bytes directly, skipping a Python-side decode.
+    with open(config_path, "rb") as f:
+        raw = yaml.load(f, Loader=_Loader)
+
+    return PipelineConfig(**_require_mapping(raw))
+
+
+def _require_mapping(raw: Any) -> dict[str, Any]:
     if not isinstance(raw, dict):
         raise ValueError(f"Invalid config: expected a YAML mapping, got {type(raw).__name__}")
-
-    return PipelineConfig(**raw)
+    return raw
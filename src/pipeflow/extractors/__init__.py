@@ -2,31 +2,57 @@
 
 from __future__ import annotations
 
-from pipeflow.config import ExtractConfig
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
 from pipeflow.extractors.base import Extractor
 
+if TYPE_CHECKING:
+    from pipeflow.config import ExtractConfig
 
-def build_extractor(config: ExtractConfig) -> Extractor:
-    """Factory: build an extractor from config."""
+
+def _build_csv(config: ExtractConfig) -> Extractor:
     from pipeflow.extractors.csv_ext import CSVExtractor
+
+    return CSVExtractor(
+        path=config.path or "",
+        delimiter=config.delimiter,
+        encoding=config.encoding,
+        engine=config.engine,
+    )
+
+
+def _build_json(config: ExtractConfig) -> Extractor:
     from pipeflow.extractors.json_ext import JSONExtractor
+
+    return JSONExtractor(path=config.path or "", format=config.type)
+
+
+def _build_api(config: ExtractConfig) -> Extractor:
     from pipeflow.extractors.api import APIExtractor
 
-    match config.type:
-        case "csv":
-            return CSVExtractor(
-                path=config.path or "",
-                delimiter=config.delimiter,
-                encoding=config.encoding,
-            )
-        case "json" | "jsonl":
-            return JSONExtractor(path=config.path or "", format=config.type)
-        case "api":
-            return APIExtractor(
-                url=config.url or "",
-                headers=config.headers,
-                params=config.params,
-                pagination=config.pagination,
-            )
-        case _:
-            raise ValueError(f"Unknown extractor type: {config.type}")
\ No newline at end of file
+    return APIExtractor(
+        url=config.url or "",
+        headers=config.headers,
+        params=config.params,
+        pagination=config.pagination,
+        keep_alive=config.keep_alive,
+    )
+
+
+# Extractor type -> builder.  Builders import their backend lazily, so only
+# the extractor a pipeline actually uses gets loaded.
+EXTRACTORS: dict[str, Callable[[ExtractConfig], Extractor]] = {
+    "csv": _build_csv,
+    "json": _build_json,
+    "jsonl": _build_json,
+    "api": _build_api,
+}
+
+
+def build_extractor(config: ExtractConfig) -> Extractor:
+    """Factory: build an extractor from config."""
+    builder = EXTRACTORS.get(config.type)
+    if builder is None:
+        raise ValueError(f"Unknown extractor type: {config.type}")
+    return builder(config)
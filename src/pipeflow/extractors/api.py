@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-import json
-import urllib.request
+import re
 import urllib.parse
-from typing import Any, Iterator
+import urllib.request
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from typing import Any
 
+from pipeflow.lib.jsonlib import loads
 from pipeflow.types import Record
 
+# Matches `<url>; ... rel="next"` within a single Link header entry.
+_LINK_NEXT_RE = re.compile(r"<([^>]+)>\s*;[^,]*?rel=[\"']next[\"']")
+
 
 class APIExtractor:
     """Extract records from an HTTP API endpoint.
@@ -16,6 +22,16 @@ class APIExtractor:
     Supports pagination via:
     - Link header (rel="next")
     - Offset-based (offset/limit query params)
+
+    Setting ``pagination["records_key"]`` names the array holding the
+    records (e.g. ``"results"``).  With ijson installed, that array is
+    parsed incrementally and its records are yielded while the body is
+    still downloading; pages of any other shape yield the same records as
+    without ijson.
+
+    With ``keep_alive=True`` pages are fetched through a urllib3 connection
+    pool, so paginated requests reuse one connection instead of paying a
+    TCP/TLS handshake per page.
     """
 
     def __init__(
@@ -24,31 +40,94 @@ class APIExtractor:
         headers: dict[str, str] | None = None,
         params: dict[str, str] | None = None,
         pagination: dict[str, Any] | None = None,
+        keep_alive: bool = False,
     ) -> None:
         self.url = url
         self.headers = headers or {}
         self.params = params or {}
         self.pagination = pagination  # e.g. {"type": "offset", "limit": 100}
+        self._pool: Any = None
+        if keep_alive:
+            try:
+                import urllib3
+            except ImportError as e:
+                raise ImportError(
+                    "keep_alive requires urllib3: pip install 'pipeflow[http]'"
+                ) from e
+            self._pool = urllib3.PoolManager(maxsize=1, headers=self.headers)
+
+        self._start_url = self._build_url(self.url, self.params)
+        self._start_offset = 0
+        self._offset_url_prefix = ""
+        if self.pagination and self.pagination.get("type") == "offset":
+            # Parse the start URL once; offset pages only swap in new numbers.
+            parsed = urllib.parse.urlparse(self._start_url)
+            query = dict(urllib.parse.parse_qsl(parsed.query))
+            self._start_offset = int(query.pop("offset", "0"))
+            query.pop("limit", None)
+            base = urllib.parse.urlunparse(parsed._replace(query="", fragment=""))
+            static_query = urllib.parse.urlencode(query)
+            self._offset_url_prefix = f"{base}?{static_query}&" if static_query else f"{base}?"
 
     def extract(self) -> Iterator[Record]:
         """Yield records, following pagination if configured."""
-        url = self._build_url(self.url, self.params)
+        page_url: str | None = self._start_url
+        offset = self._start_offset
 
-        page_url: str | None = url
+        records_key: str | None = (self.pagination or {}).get("records_key")
+        stream = records_key is not None and _ijson_available()
+        record_keys = (records_key,) if records_key else ("results", "data", "items", "records")
 
         while page_url:
-            data, next_url = self._fetch_page(page_url)
-            if isinstance(data, list):
-                yield from data
-            elif isinstance(data, dict):
-                # Support {"results": [...]} or {"data": [...]} patterns
-                for key in ("results", "data", "items", "records"):
-                    if key in data and isinstance(data[key], list):
-                        yield from data[key]
-                        break
-                else:
-                    yield data
+            if stream and records_key is not None:
+                next_url = yield from self._stream_page(page_url, offset, records_key)
+                page_url = next_url
+                if self.pagination and self.pagination.get("type") == "offset":
+                    offset += self.pagination.get("limit", 100)
+                continue
+            data, next_url = self._fetch_page(page_url, offset)
+            yield from self._records_of(data, record_keys)
             page_url = next_url
+            if self.pagination and self.pagination.get("type") == "offset":
+                offset += self.pagination.get("limit", 100)
+
+    @staticmethod
+    def _records_of(data: Any, record_keys: tuple[str, ...]) -> Iterator[Record]:
+        """Yield the records held by a decoded page body."""
+        if isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict):
+            # Support {"results": [...]} or {"data": [...]} patterns
+            for key in record_keys:
+                if key in data and isinstance(data[key], list):
+                    yield from data[key]
+                    break
+            else:
+                yield data
+
+    def close(self) -> None:
+        """Close pooled connections, if any."""
+        if self._pool is not None:
+            self._pool.clear()
+
+    @contextmanager
+    def _open(self, url: str) -> Iterator[Any]:
+        """Open *url* and yield a file-like response with ``headers``."""
+        if self._pool is None:
+            req = urllib.request.Request(url, headers=self.headers)
+            with urllib.request.urlopen(req) as response:
+                yield response
+            return
+
+        response = self._pool.request("GET", url, preload_content=False)
+        try:
+            if response.status >= 400:
+                raise ValueError(f"HTTP {response.status} fetching {url}")
+            yield response
+        finally:
+            # Read off any unconsumed body so the connection can be reused.
+            response.drain_conn()
+            response.release_conn()
 
     def _build_url(self, base_url: str, params: dict[str, str]) -> str:
         if not params:
@@ -56,15 +135,62 @@ class APIExtractor:
         sep = "&" if "?" in base_url else "?"
         return base_url + sep + urllib.parse.urlencode(params)
 
-    def _fetch_page(self, url: str) -> tuple[Any, str | None]:
+    def _fetch_page(self, url: str, offset: int) -> tuple[Any, str | None]:
         """Fetch a single page. Returns (data, next_url)."""
-        req = urllib.request.Request(url, headers=self.headers)
-        with urllib.request.urlopen(req) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            next_url = self._get_next_url(response, data, url)
+        with self._open(url) as response:
+            data = loads(response.read())
+            next_url = self._get_next_url(response, data, offset)
         return data, next_url
 
-    def _get_next_url(self, response: Any, data: Any, current_url: str) -> str | None:
+    def _stream_page(
+        self, url: str, offset: int, records_key: str
+    ) -> Generator[Record, None, str | None]:
+        """Yield records from one page as ijson parses them. Returns next_url.
+
+        Only an array under *records_key* in an object root is streamed.  The
+        rest of the body is built alongside it, so a list root, or an object
+        without that array, ends up decoded whole and is handled exactly like
+        a buffered page.
+        """
+        import ijson
+
+        with self._open(url) as response:
+            events = ijson.parse(response, use_float=True)
+            root = ijson.ObjectBuilder()
+            item_prefix = f"{records_key}.item"
+            root_is_map = in_records = streamed = False
+            count = 0
+            for prefix, event, value in events:
+                if in_records and prefix == item_prefix:
+                    if event in ("start_map", "start_array"):
+                        # Build one record from its events, as ijson.items does.
+                        item = ijson.ObjectBuilder()
+                        end_event = event.replace("start", "end", 1)
+                        while (prefix, event) != (item_prefix, end_event):
+                            item.event(event, value)
+                            prefix, event, value = next(events)
+                        value = item.value
+                    count += 1
+                    yield value
+                    continue
+                if prefix == "" and event == "start_map":
+                    root_is_map = True
+                elif root_is_map and prefix == records_key:
+                    if event == "start_array":
+                        in_records = streamed = True
+                    elif event == "end_array":
+                        in_records = False
+                root.event(event, value)
+
+            data = root.value
+            if streamed:
+                return self._get_next_url(response, data, offset, page_size=count)
+            yield from self._records_of(data, (records_key,))
+            return self._get_next_url(response, data, offset)
+
+    def _get_next_url(
+        self, response: Any, data: Any, offset: int, page_size: int | None = None
+    ) -> str | None:
         """Determine next page URL from response."""
         # Check Link header first
         link_header = response.headers.get("Link", "")
@@ -82,24 +208,23 @@ class APIExtractor:
         # Offset-based pagination
         if self.pagination and self.pagination.get("type") == "offset":
             limit = self.pagination.get("limit", 100)
-            if isinstance(data, list) and len(data) >= limit:
-                parsed = urllib.parse.urlparse(current_url)
-                params = dict(urllib.parse.parse_qsl(parsed.query))
-                current_offset = int(params.get("offset", "0"))
-                params["offset"] = str(current_offset + limit)
-                params["limit"] = str(limit)
-                new_query = urllib.parse.urlencode(params)
-                return urllib.parse.urlunparse(parsed._replace(query=new_query))
+            if isinstance(data, list):
+                page_size = len(data)
+            if page_size is not None and page_size >= limit:
+                return f"{self._offset_url_prefix}offset={offset + limit}&limit={limit}"
 
         return None
 
     @staticmethod
     def _parse_link_header(header: str) -> str | None:
         """Parse Link header for rel='next'."""
-        for part in header.split(","):
-            part = part.strip()
-            if 'rel="next"' in part or "rel='next'" in part:
-                url_part = part.split(";")[0].strip()
-                if url_part.startswith("<") and url_part.endswith(">"):
-                    return url_part[1:-1]
-        return None
+        match = _LINK_NEXT_RE.search(header)
+        return match.group(1) if match else None
+
+
+def _ijson_available() -> bool:
+    try:
+        import ijson  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -1,8 +1,10 @@
-"""Extractor protocol — all extractors implement this interface."""
+"""Extractor protocols — all extractors implement ``Extractor``."""
 
 from __future__ import annotations
 
-from typing import Iterator, Protocol
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Protocol, runtime_checkable
 
 from pipeflow.types import Record
 
@@ -13,3 +15,30 @@ class Extractor(Protocol):
     def extract(self) -> Iterator[Record]:
         """Yield records from the source."""
         ...
+
+
+@runtime_checkable
+class BatchExtractor(Protocol):
+    """Optional protocol for extractors that can produce records in batches.
+
+    Sources that parse in blocks (e.g. the arrow CSV engine) hand each block
+    over as one list instead of paying a generator step per record.
+    """
+
+    def batch_extract(self, batch_size: int) -> Iterator[list[Record]]:
+        """Yield non-empty lists of records, roughly *batch_size* long."""
+        ...
+
+
+def iter_batches(records: Iterable[Record], batch_size: int) -> Iterator[list[Record]]:
+    """Group a record stream into lists of at most *batch_size* records."""
+    it = iter(records)
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
+
+def extract_batches(extractor: Extractor, batch_size: int) -> Iterator[list[Record]]:
+    """Use the extractor's native batches when it has them, else chunk extract()."""
+    if isinstance(extractor, BatchExtractor):
+        return extractor.batch_extract(batch_size)
+    return iter_batches(extractor.extract(), batch_size)
@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
 
+from pipeflow.extractors.base import iter_batches
+from pipeflow.lib.jsonlib import SHARES_KEYS, load_path, loads
 from pipeflow.types import Record
 
+# JSON arrays larger than this are streamed with ijson when it is installed.
+STREAM_THRESHOLD = 1 << 20
+
 
 class JSONExtractor:
-    """Extract records from a JSON array file or JSONL (one JSON object per line)."""
+    """Extract records from a JSON array file or JSONL (one JSON object per line).
+
+    JSON arrays over ``stream_threshold`` bytes are parsed incrementally with
+    ijson (``pipeflow[stream]``) so memory stays flat; smaller files, other
+    root types, and installs without ijson load the document in one go.
+    """
 
-    def __init__(self, path: str, format: str = "json") -> None:
+    def __init__(
+        self, path: str, format: str = "json", stream_threshold: int = STREAM_THRESHOLD
+    ) -> None:
         self.path = Path(path)
         self.format = format
+        self.stream_threshold = stream_threshold
 
     def extract(self) -> Iterator[Record]:
         """Yield records from the file."""
@@ -22,23 +35,76 @@ class JSONExtractor:
             raise FileNotFoundError(f"JSON file not found: {self.path}")
         if self.format == "jsonl":
             yield from self._extract_jsonl()
+        elif self._should_stream():
+            yield from self._stream_json()
         else:
-            yield from self._extract_json()
+            yield from self._load_json()
 
-    def _extract_json(self) -> Iterator[Record]:
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    def batch_extract(self, batch_size: int) -> Iterator[list[Record]]:
+        """Yield lists of records; JSON arrays are sliced without a per-item step."""
+        if not self.path.exists():
+            raise FileNotFoundError(f"JSON file not found: {self.path}")
+        if self.format == "jsonl":
+            yield from iter_batches(self._extract_jsonl(), batch_size)
+            return
+        if self._should_stream():
+            yield from iter_batches(self._stream_json(), batch_size)
+            return
+        records = self._load_json()
+        for start in range(0, len(records), batch_size):
+            yield records[start:start + batch_size]
+
+    def _load_json(self) -> list[Record]:
+        data = load_path(self.path)
         if isinstance(data, list):
-            for item in data:
-                yield item
-        elif isinstance(data, dict):
-            yield data
-        else:
-            raise ValueError(f"Unexpected JSON root type: {type(data).__name__}")
+            return data
+        if isinstance(data, dict):
+            return [data]
+        raise ValueError(f"Unexpected JSON root type: {type(data).__name__}")
+
+    def _should_stream(self) -> bool:
+        """True for a large file whose root is an array and ijson is importable."""
+        if self.path.stat().st_size <= self.stream_threshold:
+            return False
+        try:
+            import ijson  # noqa: F401
+        except ImportError:
+            return False
+        with open(self.path, "rb") as f:
+            head = f.read(4096).removeprefix(b"\xef\xbb\xbf").lstrip()
+        return head.startswith(b"[")
+
+    def _stream_json(self) -> Iterator[Record]:
+        import ijson
+
+        with open(self.path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
 
     def _extract_jsonl(self) -> Iterator[Record]:
-        with open(self.path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    yield json.loads(line)
+        # Lines stay as bytes; the JSON parser decodes UTF-8 itself.
+        with open(self.path, "rb") as f:
+            records = (loads(line) for line in f if line.strip())
+            if SHARES_KEYS:
+                yield from records
+            else:
+                yield from _share_keys(records)
+
+
+def _share_keys(records: Iterator[Any]) -> Iterator[Any]:
+    """Rebuild records on interned keys while consecutive lines share a shape.
+
+    The stdlib decoder allocates fresh key strings for every line; interning
+    them once per shape keeps one copy per column and lets transforms match
+    their (interned) column names by identity.
+    """
+    shape: tuple[str, ...] = ()
+    keys: tuple[str, ...] = ()
+    for record in records:
+        if type(record) is not dict:
+            yield record
+            continue
+        current = tuple(record)
+        if current != shape:
+            shape = current
+            keys = tuple([sys.intern(k) for k in current])
+        yield dict(zip(keys, record.values()))
@@ -0,0 +1,56 @@
+"""JSON encoding and decoding that prefers orjson when it is installed.
+
+``loads`` accepts ``bytes`` or ``str``; with orjson present the bytes path
+skips Python's UTF-8 decode entirely.  ``load_path`` decodes a whole file
+and ``dumps`` encodes compactly to ``str``.  ``SHARES_KEYS`` tells whether
+decoded objects share key strings across ``loads`` calls.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+    from orjson import loads
+
+    _ACCEPTS_BUFFER = True
+    # orjson reuses one str object per short object key across calls.
+    SHARES_KEYS = True
+
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as compact JSON text."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - depends on the environment
+    import json
+    from json import loads  # type: ignore[assignment]
+
+    _ACCEPTS_BUFFER = False
+    SHARES_KEYS = False
+
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+__all__ = ["SHARES_KEYS", "dumps", "load_path", "loads"]
+
+
+def load_path(path: str | os.PathLike[str]) -> Any:
+    """Decode the JSON document stored at *path*.
+
+    With orjson the file is memory-mapped and parsed in place, without a
+    Python-level read into an intermediate ``bytes`` object.
+    """
+    with open(path, "rb") as f:
+        if not _ACCEPTS_BUFFER or os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let the parser report them.
+            return loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return loads(view)
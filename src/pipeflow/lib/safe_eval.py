@@ -1,15 +1,21 @@
-"""Restricted expression evaluator — replaces eval() for user-supplied expressions.
+"""Restricted expression evaluator for user-supplied expressions.
 
 Only allows safe AST nodes: comparisons, boolean ops, arithmetic, string
 methods, attribute access, and literal values.  Blocks imports, function
-calls (except whitelisted), __dunder__ attributes, exec/eval/compile.
+calls (except whitelisted), __dunder__ names and attributes,
+exec/eval/compile.
+
+An expression is validated against the whitelist once, compiled to a code
+object, and cached; evaluation then runs as ordinary bytecode with no
+builtins in scope.
 """
 
 from __future__ import annotations
 
 import ast
-import operator
-from typing import Any
+import functools
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 # Whitelisted string methods callable on values
 _SAFE_STR_METHODS = frozenset({
@@ -33,226 +39,336 @@ _SAFE_BUILTINS: dict[str, Any] = {
     "None": None,
 }
 
-_CMP_OPS: dict[type, Any] = {
-    ast.Eq: operator.eq,
-    ast.NotEq: operator.ne,
-    ast.Lt: operator.lt,
-    ast.LtE: operator.le,
-    ast.Gt: operator.gt,
-    ast.GtE: operator.ge,
-    ast.Is: operator.is_,
-    ast.IsNot: operator.is_not,
-    ast.In: lambda a, b: a in b,
-    ast.NotIn: lambda a, b: a not in b,
-}
+_CMP_OPS: frozenset[type] = frozenset({
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.Is, ast.IsNot, ast.In, ast.NotIn,
+})
 
-_BIN_OPS: dict[type, Any] = {
-    ast.Add: operator.add,
-    ast.Sub: operator.sub,
-    ast.Mult: operator.mul,
-    ast.Div: operator.truediv,
-    ast.FloorDiv: operator.floordiv,
-    ast.Mod: operator.mod,
-}
+_BIN_OPS: frozenset[type] = frozenset({
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+})
 
-_UNARY_OPS: dict[type, Any] = {
-    ast.UAdd: operator.pos,
-    ast.USub: operator.neg,
-    ast.Not: operator.not_,
-}
+_UNARY_OPS: frozenset[type] = frozenset({ast.UAdd, ast.USub, ast.Not})
+
+_BOOL_OPS: frozenset[type] = frozenset({ast.And, ast.Or})
+
+_BLOCKED_CALLS = frozenset({
+    "eval", "exec", "compile", "type", "__import__", "globals", "locals",
+    "getattr", "setattr", "delattr", "open", "input", "breakpoint",
+})
+
+# Compiled expressions reach builtins and the method-call guard through these
+# reserved global names.  User names starting with "__" are rejected, so an
+# expression can neither reference nor redefine them.
+_RESERVED_PREFIX = "__pf_"
+_CALL_METHOD = _RESERVED_PREFIX + "call_method"
+
+
+def _call_method(obj: Any, method_name: str, *args: Any, **kwargs: Any) -> Any:
+    """Call a whitelisted string method; the receiver type is only known at runtime."""
+    if isinstance(obj, str) and method_name in _SAFE_STR_METHODS:
+        return getattr(obj, method_name)(*args, **kwargs)
+    raise ValueError(
+        f"Method call '.{method_name}()' is not allowed on {type(obj).__name__}"
+    )
 
-_BOOL_OPS: dict[type, str] = {
-    ast.And: "and",
-    ast.Or: "or",
+
+_GLOBALS: dict[str, Any] = {
+    "__builtins__": {},
+    _CALL_METHOD: _call_method,
+    **{_RESERVED_PREFIX + name: value for name, value in _SAFE_BUILTINS.items()},
 }
 
 
-class _SafeEval(ast.NodeVisitor):
-    """Walk an AST and evaluate it with a restricted set of operations."""
+def _reserved_name(name: str, like: ast.AST) -> ast.Name:
+    return ast.copy_location(ast.Name(id=_RESERVED_PREFIX + name, ctx=ast.Load()), like)
+
+
+class _Validator(ast.NodeTransformer):
+    """Reject nodes outside the whitelist and rewrite the rest for eval().
+
+    Builtin names become reserved globals, and method calls are routed
+    through ``_call_method`` so the str-only check still runs per call.
+    """
+
+    # Node type -> visit_* function, filled in below the class.  Replaces
+    # NodeVisitor's per-node "visit_" + class-name getattr lookup.
+    _dispatch: ClassVar[dict[type, Callable[[_Validator, Any], Any]]] = {}
 
-    def __init__(self, variables: dict[str, Any]) -> None:
-        self.variables = variables
+    def visit(self, node: ast.AST) -> Any:
+        return self._dispatch.get(type(node), _Validator.generic_visit)(self, node)
 
     # ------------------------------------------------------------------
     # Literals
     # ------------------------------------------------------------------
 
-    def visit_Constant(self, node: ast.Constant) -> Any:
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
         if isinstance(node.value, (int, float, str, bool, type(None))):
-            return node.value
+            return node
         raise ValueError(f"Unsupported constant type: {type(node.value).__name__}")
 
     # ------------------------------------------------------------------
     # Variables & attribute access
     # ------------------------------------------------------------------
 
-    def visit_Name(self, node: ast.Name) -> Any:
-        name = node.id
-        if name in _SAFE_BUILTINS:
-            return _SAFE_BUILTINS[name]
-        if name in self.variables:
-            return self.variables[name]
-        raise NameError(f"Undefined name: {name!r}")
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id.startswith("__"):
+            raise ValueError(f"Access to dunder name '{node.id}' is not allowed")
+        if node.id in _SAFE_BUILTINS:
+            return _reserved_name(node.id, node)
+        return node
 
-    def visit_Attribute(self, node: ast.Attribute) -> Any:
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
         if node.attr.startswith("__"):
             raise ValueError(f"Access to dunder attribute '{node.attr}' is not allowed")
-        value = self.visit(node.value)
-        return getattr(value, node.attr)
+        node.value = self.visit(node.value)
+        return node
 
-    def visit_Subscript(self, node: ast.Subscript) -> Any:
-        value = self.visit(node.value)
-        key = self.visit(node.slice)
-        return value[key]
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        node.value = self.visit(node.value)
+        node.slice = self.visit(node.slice)
+        return node
 
     # ------------------------------------------------------------------
     # Operators
     # ------------------------------------------------------------------
 
-    def visit_BinOp(self, node: ast.BinOp) -> Any:
-        op_func = _BIN_OPS.get(type(node.op))
-        if op_func is None:
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if type(node.op) not in _BIN_OPS:
             raise ValueError(f"Unsupported binary operator: {type(node.op).__name__}")
-        return op_func(self.visit(node.left), self.visit(node.right))
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
 
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> Any:
-        op_func = _UNARY_OPS.get(type(node.op))
-        if op_func is None:
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if type(node.op) not in _UNARY_OPS:
             raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-        return op_func(self.visit(node.operand))
+        node.operand = self.visit(node.operand)
+        return node
 
-    def visit_BoolOp(self, node: ast.BoolOp) -> Any:
-        op_kind = _BOOL_OPS.get(type(node.op))
-        if op_kind is None:
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        if type(node.op) not in _BOOL_OPS:
             raise ValueError(f"Unsupported boolean operator: {type(node.op).__name__}")
-        if op_kind == "and":
-            result: Any = True
-            for val_node in node.values:
-                result = self.visit(val_node)
-                if not result:
-                    return result
-            return result
-        else:  # or
-            result = False
-            for val_node in node.values:
-                result = self.visit(val_node)
-                if result:
-                    return result
-            return result
-
-    def visit_Compare(self, node: ast.Compare) -> Any:
-        left = self.visit(node.left)
-        for op, comparator in zip(node.ops, node.comparators):
-            op_func = _CMP_OPS.get(type(op))
-            if op_func is None:
+        node.values = [self.visit(value) for value in node.values]
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        for op in node.ops:
+            if type(op) not in _CMP_OPS:
                 raise ValueError(f"Unsupported comparison: {type(op).__name__}")
-            right = self.visit(comparator)
-            if not op_func(left, right):
-                return False
-            left = right
-        return True
+        node.left = self.visit(node.left)
+        node.comparators = [self.visit(c) for c in node.comparators]
+        return node
 
     # ------------------------------------------------------------------
     # Function calls — only whitelisted builtins and string methods
     # ------------------------------------------------------------------
 
-    def visit_Call(self, node: ast.Call) -> Any:
-        # Method call: value.method(args)
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        args = [self.visit(a) for a in node.args]
+        keywords = [self.visit(k) for k in node.keywords]
+
+        # Method call: value.method(args) -> __pf_call_method(value, "method", args)
         if isinstance(node.func, ast.Attribute):
             if node.func.attr.startswith("__"):
                 raise ValueError(
                     f"Call to dunder method '{node.func.attr}' is not allowed"
                 )
-            obj = self.visit(node.func.value)
-            method_name = node.func.attr
-            if isinstance(obj, str) and method_name in _SAFE_STR_METHODS:
-                args = [self.visit(a) for a in node.args]
-                return getattr(obj, method_name)(*args)
-            raise ValueError(
-                f"Method call '.{method_name}()' is not allowed on {type(obj).__name__}"
+            receiver = self.visit(node.func.value)
+            method = ast.copy_location(ast.Constant(value=node.func.attr), node.func)
+            return ast.copy_location(
+                ast.Call(
+                    func=ast.Name(id=_CALL_METHOD, ctx=ast.Load()),
+                    args=[receiver, method, *args],
+                    keywords=keywords,
+                ),
+                node,
             )
 
         # Free-standing call: func(args)
         if isinstance(node.func, ast.Name):
             func_name = node.func.id
-            if func_name in ("eval", "exec", "compile", "type",
-                             "__import__", "globals", "locals",
-                             "getattr", "setattr", "delattr",
-                             "open", "input", "breakpoint"):
+            if func_name in _BLOCKED_CALLS:
                 raise ValueError(f"Call to '{func_name}' is not allowed")
-            func = _SAFE_BUILTINS.get(func_name)
-            if func is not None and callable(func):
-                args = [self.visit(a) for a in node.args]
-                return func(*args)
+            if callable(_SAFE_BUILTINS.get(func_name)):
+                node.func = _reserved_name(func_name, node.func)
+                node.args = args
+                node.keywords = keywords
+                return node
             raise ValueError(f"Call to '{func_name}' is not allowed")
 
         raise ValueError("Unsupported call expression")
 
+    def visit_keyword(self, node: ast.keyword) -> ast.AST:
+        if node.arg is None:
+            raise ValueError("Keyword argument unpacking is not allowed")
+        node.value = self.visit(node.value)
+        return node
+
     # ------------------------------------------------------------------
     # Containers
     # ------------------------------------------------------------------
 
-    def visit_List(self, node: ast.List) -> list[Any]:
-        return [self.visit(el) for el in node.elts]
+    def visit_List(self, node: ast.List) -> ast.AST:
+        node.elts = [self.visit(el) for el in node.elts]
+        return node
 
-    def visit_Tuple(self, node: ast.Tuple) -> tuple[Any, ...]:
-        return tuple(self.visit(el) for el in node.elts)
+    def visit_Tuple(self, node: ast.Tuple) -> ast.AST:
+        node.elts = [self.visit(el) for el in node.elts]
+        return node
 
-    def visit_Dict(self, node: ast.Dict) -> dict[Any, Any]:
-        return {
-            self.visit(k): self.visit(v)
-            for k, v in zip(node.keys, node.values)
-            if k is not None
-        }
+    def visit_Dict(self, node: ast.Dict) -> ast.AST:
+        if any(k is None for k in node.keys):
+            raise ValueError("Dict unpacking is not allowed")
+        node.keys = [self.visit(k) for k in node.keys if k is not None]
+        node.values = [self.visit(v) for v in node.values]
+        return node
 
     # ------------------------------------------------------------------
     # Expression wrapper
     # ------------------------------------------------------------------
 
-    def visit_Expression(self, node: ast.Expression) -> Any:
-        return self.visit(node.body)
+    def visit_Expression(self, node: ast.Expression) -> ast.AST:
+        node.body = self.visit(node.body)
+        return node
 
     # ------------------------------------------------------------------
     # Conditional expression (ternary)
     # ------------------------------------------------------------------
 
-    def visit_IfExp(self, node: ast.IfExp) -> Any:
-        return self.visit(node.body) if self.visit(node.test) else self.visit(node.orelse)
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        node.test = self.visit(node.test)
+        node.body = self.visit(node.body)
+        node.orelse = self.visit(node.orelse)
+        return node
 
     # ------------------------------------------------------------------
     # JoinedStr (f-string)
     # ------------------------------------------------------------------
 
-    def visit_JoinedStr(self, node: ast.JoinedStr) -> str:
-        parts = []
-        for value in node.values:
-            parts.append(str(self.visit(value)))
-        return "".join(parts)
+    def visit_JoinedStr(self, node: ast.JoinedStr) -> ast.AST:
+        node.values = [self.visit(value) for value in node.values]
+        return node
 
-    def visit_FormattedValue(self, node: ast.FormattedValue) -> Any:
-        return self.visit(node.value)
+    def visit_FormattedValue(self, node: ast.FormattedValue) -> ast.AST:
+        node.value = self.visit(node.value)
+        if node.format_spec is not None:
+            node.format_spec = self.visit(node.format_spec)
+        return node
 
     # ------------------------------------------------------------------
     # Catch-all
     # ------------------------------------------------------------------
 
-    def generic_visit(self, node: ast.AST) -> None:
+    def generic_visit(self, node: ast.AST) -> ast.AST:
         raise ValueError(
             f"Unsupported expression node: {type(node).__name__}"
         )
 
 
+_Validator._dispatch = {
+    getattr(ast, name.removeprefix("visit_")): method
+    for name, method in vars(_Validator).items()
+    if name.startswith("visit_")
+}
+
+
+_Evaluator = Callable[[dict[str, Any]], Any]
+
+# Node types of a straight-line arithmetic/comparison expression: every name
+# in it is evaluated unconditionally, so the names can be bound up front.
+_ARITHMETIC_NODES: frozenset[type] = frozenset({
+    ast.Expression, ast.Constant, ast.Name, ast.Load,
+    ast.BinOp, ast.UnaryOp, ast.Compare,
+}) | _BIN_OPS | _UNARY_OPS | _CMP_OPS
+
+
+def _specialize_arithmetic(tree: ast.Expression) -> _Evaluator | None:
+    """Compile an arithmetic-only expression into a plain Python function.
+
+    ``(price * qty) - discount`` becomes a function that binds each name to a
+    fast local and returns the expression, which avoids the ``eval()`` call
+    and dict-backed name lookups.  Returns None for any other expression
+    shape (boolean ops, conditionals, chained comparisons, calls, ...).
+    """
+    names: dict[str, None] = {}
+    for node in ast.walk(tree):
+        if type(node) not in _ARITHMETIC_NODES:
+            return None
+        if isinstance(node, ast.Compare) and len(node.ops) > 1:
+            return None
+        if isinstance(node, ast.Name):
+            if node.id.startswith(_RESERVED_PREFIX):
+                return None
+            names[node.id] = None
+
+    param = _RESERVED_PREFIX + "vars"
+    bindings = [f"        {name} = {param}[{name!r}]" for name in names]
+    source = "\n".join([
+        f"def {_RESERVED_PREFIX}expr({param}):",
+        "    try:",
+        *(bindings or ["        pass"]),
+        f"    except {_RESERVED_PREFIX}KeyError as e:",
+        (
+            f"        raise {_RESERVED_PREFIX}NameError("
+            f"f'Undefined name: {{e.args[0]!r}}', name=e.args[0]) from None"
+        ),
+        f"    return {ast.unparse(tree.body)}",
+    ])
+    namespace: dict[str, Any] = {
+        "__builtins__": {},
+        _RESERVED_PREFIX + "KeyError": KeyError,
+        _RESERVED_PREFIX + "NameError": NameError,
+    }
+    # The source embeds only the whitelisted, already validated expression.
+    exec(compile(source, "<expression>", "exec"), namespace)  # noqa: S102
+    function: _Evaluator = namespace[_RESERVED_PREFIX + "expr"]
+    return function
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(expression: str) -> _Evaluator:
+    """Validate *expression* and compile it once; cached by expression string."""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression syntax: {e}") from e
+    tree = ast.fix_missing_locations(_Validator().visit(tree))
+    specialized = _specialize_arithmetic(tree)
+    if specialized is not None:
+        return specialized
+    code = compile(tree, "<expression>", "eval")
+
+    def evaluate(variables: dict[str, Any]) -> Any:
+        try:
+            return eval(code, _GLOBALS, variables)
+        except NameError as e:
+            # Same message as the arithmetic fast path.
+            raise NameError(f"Undefined name: {e.name!r}", name=e.name) from None
+
+    return evaluate
+
+
+def compile_expression(expression: str) -> Callable[[dict[str, Any]], Any]:
+    """Validate *expression* now and return a function evaluating it.
+
+    The function takes the variables dict and raises ``NameError`` for
+    undefined names.  Use it to hoist validation out of per-record loops;
+    ``ValueError`` is raised here for disallowed constructs.
+    """
+    return _compile(expression)
+
+
 def safe_eval(expression: str, variables: dict[str, Any]) -> Any:
     """Evaluate *expression* in a restricted environment.
 
     Only arithmetic, comparisons, boolean ops, string methods, and
     whitelisted builtins (len, str, int, float, abs, min, max, round)
     are permitted.  Raises ``ValueError`` on disallowed constructs.
+    The expression is validated and compiled once and cached, so repeated
+    calls with the same expression only pay for evaluation.
     """
     try:
-        tree = ast.parse(expression, mode="eval")
-    except SyntaxError as e:
-        raise ValueError(f"Invalid expression syntax: {e}") from e
-
-    evaluator = _SafeEval(variables)
-    return evaluator.visit(tree)
+        return _compile(expression)(variables)
+    except NameError as e:
+        raise NameError(f"Undefined name: {e.name!r}") from None
@@ -2,25 +2,51 @@
 
 from __future__ import annotations
 
-from pipeflow.config import LoadConfig
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
 from pipeflow.loaders.base import Loader
 
+if TYPE_CHECKING:
+    from pipeflow.config import LoadConfig
 
-def build_loader(config: LoadConfig) -> Loader:
-    """Factory: build a loader from config."""
+
+def _build_sqlite(config: LoadConfig) -> Loader:
     from pipeflow.loaders.sqlite import SQLiteLoader
+
+    return SQLiteLoader(
+        database=config.database or ":memory:",
+        table=config.table or "data",
+        mode=config.mode,
+        conflict_key=config.conflict_key,
+        batch_size=config.batch_size,
+        wal=config.wal,
+        pre_serialized=config.pre_serialized,
+        commit_every=config.commit_every,
+    )
+
+
+def _build_csv(config: LoadConfig) -> Loader:
     from pipeflow.loaders.csv_writer import CSVWriterLoader
 
-    match config.type:
-        case "sqlite":
-            return SQLiteLoader(
-                database=config.database or ":memory:",
-                table=config.table or "data",
-                mode=config.mode,
-                conflict_key=config.conflict_key,
-                batch_size=config.batch_size,
-            )
-        case "csv":
-            return CSVWriterLoader(path=config.path or "output.csv")
-        case _:
-            raise ValueError(f"Unknown loader type: {config.type}")
\ No newline at end of file
+    return CSVWriterLoader(path=config.path or "output.csv")
+
+
+# Loader type -> builder.  Builders import their backend lazily.
+LOADERS: dict[str, Callable[[LoadConfig], Loader]] = {
+    "sqlite": _build_sqlite,
+    "csv": _build_csv,
+}
+
+
+def build_loader(config: LoadConfig) -> Loader:
+    """Factory: build a loader from config."""
+    builder = LOADERS.get(config.type)
+    if builder is None:
+        raise ValueError(f"Unknown loader type: {config.type}")
+    loader = builder(config)
+    if config.background:
+        from pipeflow.loaders.threaded import ThreadedLoader
+
+        return ThreadedLoader(loader)
+    return loader
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Callable, Iterator, Sequence
+from operator import itemgetter
 from pathlib import Path
-from typing import IO, Sequence
+from typing import IO, Any
 
 from pipeflow.types import Record
 
 
 class CSVWriterLoader:
-    """Write records to a CSV file."""
+    """Write records to a CSV file.
+
+    Columns come from the first record.  Like ``csv.DictWriter``, later
+    records missing a column write an empty value and records with extra
+    columns raise ValueError.
+    """
 
     def __init__(self, path: str) -> None:
         self.path = Path(path)
         self._file: IO[str] | None = None
-        self._writer: csv.DictWriter[str] | None = None
-        self._header_written = False
+        self._writer: Any = None  # csv.writer; its type is private to _csv
+        self._fieldnames: list[str] = []
+        self._fieldset: frozenset[str] = frozenset()
+        self._getter: Callable[[Record], Any] | None = None
 
     def load(self, records: Sequence[Record]) -> int:
         """Append records to the CSV file. Returns count written."""
@@ -24,23 +33,45 @@ class CSVWriterLoader:
             return 0
 
         if self._file is None:
-            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._file = open(
+                self.path, "w", newline="", encoding="utf-8", buffering=1 << 20
+            )
 
         if self._writer is None:
-            fieldnames = list(records[0].keys())
-            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+            self._fieldnames = list(records[0].keys())
+            self._fieldset = frozenset(self._fieldnames)
+            if len(self._fieldnames) == 1:
+                only = self._fieldnames[0]
+                self._getter = lambda record: (record[only],)
+            else:
+                self._getter = itemgetter(*self._fieldnames)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self._fieldnames)
 
-        if not self._header_written:
-            self._writer.writeheader()
-            self._header_written = True
+        # Output is buffered; close() flushes it.
+        self._writer.writerows(self._rows(records))
+        return len(records)
 
-        count = 0
+    def _rows(self, records: Sequence[Record]) -> Iterator[Any]:
+        """Yield rows in header order; records with the header's exact key set
+        are read with one itemgetter call."""
+        getter = self._getter
+        assert getter is not None
+        fieldset = self._fieldset
         for record in records:
-            self._writer.writerow(record)
-            count += 1
+            if record.keys() == fieldset:
+                yield getter(record)
+            else:
+                yield self._row_slow(record)
 
-        self._file.flush()
-        return count
+    def _row_slow(self, record: Record) -> list[Any]:
+        extra = record.keys() - self._fieldset
+        if extra:
+            raise ValueError(
+                "dict contains fields not in fieldnames: "
+                + ", ".join(repr(k) for k in extra)
+            )
+        return [record.get(name, "") for name in self._fieldnames]
 
     def close(self) -> None:
         if self._file is not None:
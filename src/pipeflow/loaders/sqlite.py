@@ -3,13 +3,36 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Any, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import Any
 
 from pipeflow.types import Record
 
+# Value types sqlite3 binds as-is; anything else goes through _serialize.
+_BINDABLE = frozenset({type(None), int, float, str, bool})
+
+# Applied to file databases when ``wal`` is enabled: WAL journaling with
+# NORMAL sync fsyncs far less often than the default rollback journal, and
+# readers no longer block the writer.
+_WAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=30000",
+)
+
 
 class SQLiteLoader:
-    """Load records into a SQLite database."""
+    """Load records into a SQLite database.
+
+    Batches are committed every ``commit_every`` loads and on ``close()``;
+    call ``close()`` (or ``commit()``) before reading the data elsewhere.
+    Pass ``pre_serialized=True`` when every value is already None, int, float
+    or str; rows are then bound as-is, without the per-value conversion.
+    """
 
     def __init__(
         self,
@@ -18,19 +41,37 @@ class SQLiteLoader:
         mode: str = "insert",
         conflict_key: str | None = None,
         batch_size: int = 100,
+        wal: bool = True,
+        pre_serialized: bool = False,
+        commit_every: int = 10,
     ) -> None:
         self.database = database
         self.table = table
         self.mode = mode
         self.conflict_key = conflict_key
         self.batch_size = batch_size
+        self.wal = wal
+        self.pre_serialized = pre_serialized
+        self.commit_every = max(1, commit_every)
+        self._uncommitted_batches = 0
         self._conn: sqlite3.Connection | None = None
         self._table_created = False
+        # INSERT statements by column tuple; batches usually share one shape.
+        self._sql_cache: dict[tuple[str, ...], str] = {}
 
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(self.database)
+            # The connection may be opened and used by a ThreadedLoader's
+            # writer thread; all access to it stays serialized.  Transactions
+            # are managed explicitly (see load), so the driver's implicit
+            # BEGIN handling is turned off.
+            self._conn = sqlite3.connect(
+                self.database, isolation_level=None, check_same_thread=False
+            )
+            if self.wal and self.database != ":memory:":
+                for pragma in _WAL_PRAGMAS:
+                    self._conn.execute(pragma)
         return self._conn
 
     def _ensure_table(self, columns: list[str]) -> None:
@@ -57,37 +98,90 @@ class SQLiteLoader:
         columns = list(records[0].keys())
         self._ensure_table(columns)
 
+        shape = tuple(columns)
+        sql = self._sql_cache.get(shape)
+        if sql is None:
+            sql = self._sql_cache[shape] = self._insert_sql(columns)
+
+        conn = self.conn
+        if not conn.in_transaction:
+            # Take the write lock up front rather than on the first INSERT.
+            conn.execute("BEGIN IMMEDIATE")
+        # A savepoint per batch lets a failing batch be undone without losing
+        # the earlier, still uncommitted batches that load() already counted.
+        conn.execute("SAVEPOINT batch")
+        try:
+            conn.executemany(sql, self._rows(records, columns))
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK TO batch")
+                conn.execute("RELEASE batch")
+            else:  # SQLite already rolled back the whole transaction
+                self._uncommitted_batches = 0
+            raise
+        conn.execute("RELEASE batch")
+        self._uncommitted_batches += 1
+        if self._uncommitted_batches >= self.commit_every:
+            self.commit()
+        return len(records)
+
+    def commit(self) -> None:
+        """Commit any batches loaded since the last commit."""
+        if self._conn is not None:
+            self._conn.commit()
+        self._uncommitted_batches = 0
+
+    def _insert_sql(self, columns: list[str]) -> str:
+        """Build the INSERT (or upsert) statement for *columns*."""
         placeholders = ", ".join("?" for _ in columns)
         col_names = ", ".join(f'"{c}"' for c in columns)
 
         if self.mode == "upsert" and self.conflict_key:
             update_cols = [c for c in columns if c != self.conflict_key]
             update_clause = ", ".join(f'"{c}" = excluded."{c}"' for c in update_cols)
-            sql = (
+            return (
                 f'INSERT INTO "{self.table}" ({col_names}) VALUES ({placeholders}) '
                 f'ON CONFLICT("{self.conflict_key}") DO UPDATE SET {update_clause}'
             )
-        else:
-            sql = f'INSERT INTO "{self.table}" ({col_names}) VALUES ({placeholders})'
+        return f'INSERT INTO "{self.table}" ({col_names}) VALUES ({placeholders})'
 
-        count = 0
-        for record in records:
-            values = [self._serialize(record.get(c)) for c in columns]
-            self.conn.execute(sql, values)
-            count += 1
-        self.conn.commit()
-        return count
+    def _rows(
+        self, records: Sequence[Record], columns: list[str]
+    ) -> Iterator[tuple[Any, ...]]:
+        """Return a lazy iterator of parameter tuples, in *columns* order.
+
+        Values are gathered column by column with C-level ``map`` calls and
+        ``zip`` turns the columns back into rows as executemany consumes
+        them.  In the default mode each column's values are collected once to
+        check their types, and only columns holding non-bindable values go
+        through ``_serialize``; with ``pre_serialized`` nothing is collected.
+        """
+        # dict.get keeps NULL for records missing the column.
+        if self.pre_serialized:
+            return zip(*[map(dict.get, records, repeat(column)) for column in columns])
+
+        serialize = self._serialize
+        value_columns: list[Iterable[Any]] = []
+        for column in columns:
+            values = list(map(dict.get, records, repeat(column)))
+            if set(map(type, values)) <= _BINDABLE:
+                value_columns.append(values)
+            else:
+                value_columns.append(map(serialize, values))
+        return zip(*value_columns)
 
     @staticmethod
     def _serialize(value: Any) -> Any:
         """Convert value to a SQLite-compatible type."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str)):
+        if value is None or isinstance(value, (int, float, str)):
             return value
         return str(value)
 
     def close(self) -> None:
         if self._conn is not None:
+            self.commit()
+            if self.wal and self.database != ":memory:":
+                # Fold the WAL back into the database file and truncate it.
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             self._conn.close()
             self._conn = None
@@ -0,0 +1,59 @@
+"""Run another loader's writes on a background thread."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Sequence
+
+from pipeflow.loaders.base import Loader
+from pipeflow.types import Record
+
+_DONE = None
+
+
+class ThreadedLoader:
+    """Hand batches to a writer thread so loading overlaps extraction.
+
+    ``load`` queues the batch and returns 0 at once, since nothing has been
+    written yet; at most ``max_pending`` batches wait in the queue before
+    ``load`` blocks.  The writer thread adds what the wrapped loader reports
+    to ``records_written``, which is final once ``close`` returns.  Errors
+    raised by the wrapped loader are re-raised from the next ``load`` or from
+    ``close``; batches queued after a failure are dropped and not counted.
+    The wrapped loader is only ever used by the writer thread.
+    """
+
+    def __init__(self, loader: Loader, max_pending: int = 4) -> None:
+        self.loader = loader
+        self._queue: queue.Queue[list[Record] | None] = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self.records_written = 0
+        self._thread = threading.Thread(target=self._write, name="pipeflow-writer", daemon=True)
+        self._thread.start()
+
+    def _write(self) -> None:
+        try:
+            while (batch := self._queue.get()) is not _DONE:
+                if self._error is None:
+                    try:
+                        self.records_written += self.loader.load(batch)
+                    except BaseException as e:  # noqa: BLE001 - re-raised on the caller's thread
+                        self._error = e
+        finally:
+            self.loader.close()
+
+    def load(self, records: Sequence[Record]) -> int:
+        if self._error is not None:
+            raise self._error
+        if not records:
+            return 0
+        self._queue.put(list(records))
+        return 0
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_DONE)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
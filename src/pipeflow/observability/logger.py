@@ -2,29 +2,40 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from typing import Any
 
+from pipeflow.lib.jsonlib import dumps
+
+# Optional ``extra=`` attributes copied into the JSON output when present.
+_EXTRA_FIELDS = ("pipeline", "stage")
+
 
 class JSONFormatter(logging.Formatter):
-    """Format log records as JSON."""
+    """Format log records as JSON.
+
+    Without a ``datefmt`` the timestamp is the raw ``record.created`` epoch
+    float, which skips ``formatTime``; pass a ``datefmt`` for a text time.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         log_data: dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            "timestamp": (
+                record.created if self.datefmt is None
+                else self.formatTime(record, self.datefmt)
+            ),
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
         }
-        if hasattr(record, "pipeline"):
-            log_data["pipeline"] = getattr(record, "pipeline")
-        if hasattr(record, "stage"):
-            log_data["stage"] = getattr(record, "stage")
+        attrs = record.__dict__
+        for field in _EXTRA_FIELDS:
+            if field in attrs:
+                log_data[field] = attrs[field]
         if record.exc_info and record.exc_info[1]:
             log_data["error"] = str(record.exc_info[1])
-        return json.dumps(log_data)
+        return dumps(log_data)
 
 
 def get_logger(name: str = "pipeflow", json_format: bool = True) -> logging.Logger:
@@ -3,33 +3,45 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 
 @dataclass
 class PipelineMetrics:
-    """Collects metrics during a pipeline run."""
+    """Collects metrics during a pipeline run.
+
+    ``errors`` keeps only the most recent ``max_errors`` error samples;
+    ``error_count`` counts all of them.
+    """
 
     records_extracted: int = 0
     records_transformed: int = 0
     records_valid: int = 0
     records_invalid: int = 0
     records_loaded: int = 0
-    errors: list[dict[str, object]] = field(default_factory=list)
-    _start_time: float = field(default=0.0, repr=False)
-    _end_time: float = field(default=0.0, repr=False)
+    error_count: int = 0
+    max_errors: int = 1000
+    errors: deque[dict[str, object]] = field(init=False, repr=False)
+    # Monotonic perf_counter_ns readings; 0 means "not recorded yet".
+    _start_time: int = field(default=0, repr=False)
+    _end_time: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self.errors = deque(maxlen=self.max_errors)
 
     def start(self) -> None:
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
+        self._end_time = 0
 
     def stop(self) -> None:
-        self._end_time = time.time()
+        self._end_time = time.perf_counter_ns()
 
     @property
     def duration(self) -> float:
-        if self._end_time == 0.0:
-            return time.time() - self._start_time
-        return self._end_time - self._start_time
+        """Seconds between start() and stop(), or until now while running."""
+        end = self._end_time or time.perf_counter_ns()
+        return (end - self._start_time) / 1e9
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -39,5 +51,5 @@ class PipelineMetrics:
             "records_invalid": self.records_invalid,
             "records_loaded": self.records_loaded,
             "duration_seconds": round(self.duration, 3),
-            "error_count": len(self.errors),
+            "error_count": self.error_count,
         }
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import logging
+from typing import Any
 
 from pipeflow.config import PipelineConfig
 from pipeflow.observability.logger import get_logger
 from pipeflow.observability.metrics import PipelineMetrics
 from pipeflow.types import Record
+
 logger = get_logger(__name__, json_format=False)
 
 
@@ -15,12 +18,15 @@ class Pipeline:
 
     def __init__(self, config: PipelineConfig) -> None:
         self.config = config
-        self.metrics = PipelineMetrics()
+        max_errors = config.validate.max_errors if config.validate else 1000
+        self.metrics = PipelineMetrics(max_errors=max_errors)
 
     def run(self) -> dict[str, object]:
         """Execute the full pipeline. Returns metrics dict."""
         from pipeflow.extractors import build_extractor
+        from pipeflow.extractors.base import extract_batches
         from pipeflow.transforms import build_transforms
+        from pipeflow.transforms.base import build_stages
         from pipeflow.loaders import build_loader
         from pipeflow.validation.validator import build_validator
 
@@ -29,57 +35,88 @@ class Pipeline:
 
         # Extract
         extractor = build_extractor(self.config.extract)
-        transforms = build_transforms(self.config.transforms)
+        transforms = build_transforms(
+            self.config.transforms, reuse_records=self.config.reuse_records
+        )
         validator = build_validator(self.config.validate) if self.config.validate else None
         loader = build_loader(self.config.load)
 
-        valid_records: list[Record] = []
+        batch_size = self.config.load.batch_size
+        # Fixed-size load buffer: valid records are copied in by slice
+        # assignment and flushed as a slice copy, so the list never resizes.
+        buffer: list[Any] = [None] * batch_size
+        fill = 0
+
+        # Hot-loop state lives in locals; counters are written back to
+        # self.metrics once, when the run ends.
+        stages = build_stages(transforms)
+        validate = validator.validate_batch if validator else None
+        load = loader.load
+        error_log = self.metrics.errors
+        extracted = transformed = valid_count = invalid = loaded = 0
 
         try:
-            for record in extractor.extract():
-                self.metrics.records_extracted += 1
+            for batch in extract_batches(extractor, batch_size):
+                extracted += len(batch)
 
-                # Transform chain
-                current: Record | None = record
-                for transform in transforms:
-                    if current is None:
+                # Transform chain, one batch per transform call
+                for stage in stages:
+                    if not batch:
                         break
-                    current = transform.apply(current)
+                    batch = stage(batch)
 
-                if current is None:
+                if not batch:
                     continue
-                self.metrics.records_transformed += 1
+                transformed += len(batch)
 
                 # Validate
-                if validator:
-                    errors = validator.validate_record(current)
-                    if errors:
-                        self.metrics.records_invalid += 1
-                        self.metrics.errors.append(
-                            {"record": current, "errors": errors}
-                        )
-                        continue
-                self.metrics.records_valid += 1
-                valid_records.append(current)
+                valid: list[Record] = batch
+                if validate is not None:
+                    valid = []
+                    for current, errors in zip(batch, validate(batch)):
+                        if errors:
+                            invalid += 1
+                            error_log.append({"record": current, "errors": errors})
+                        else:
+                            valid.append(current)
+                valid_count += len(valid)
 
                 # Batch load
-                if len(valid_records) >= self.config.load.batch_size:
-                    loaded = loader.load(valid_records)
-                    self.metrics.records_loaded += loaded
-                    valid_records.clear()
+                pos = 0
+                while pos < len(valid):
+                    take = min(batch_size - fill, len(valid) - pos)
+                    buffer[fill:fill + take] = valid[pos:pos + take]
+                    fill += take
+                    pos += take
+                    if fill == batch_size:
+                        loaded += load(buffer[:fill])
+                        fill = 0
 
             # Load remaining
-            if valid_records:
-                loaded = loader.load(valid_records)
-                self.metrics.records_loaded += loaded
+            if fill:
+                loaded += load(buffer[:fill])
 
         finally:
-            loader.close()
-            self.metrics.stop()
-
-        logger.info(
-            "Pipeline '%s' complete: %s",
-            self.config.name,
-            self.metrics.to_dict(),
-        )
-        return self.metrics.to_dict()
+            metrics = self.metrics
+            metrics.records_extracted += extracted
+            metrics.records_transformed += transformed
+            metrics.records_valid += valid_count
+            metrics.records_invalid += invalid
+            metrics.error_count += invalid
+            try:
+                loader.close()
+            finally:
+                # A ThreadedLoader counts records as its writer thread stores
+                # them; its load() calls return 0.
+                metrics.records_loaded += loaded + getattr(loader, "records_written", 0)
+                # Extractors holding connections (e.g. a pooled APIExtractor)
+                # expose close(); the Extractor protocol does not require it.
+                close_extractor = getattr(extractor, "close", None)
+                if close_extractor is not None:
+                    close_extractor()
+                metrics.stop()
+
+        result = self.metrics.to_dict()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Pipeline '%s' complete: %s", self.config.name, result)
+        return result
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from pipeflow.config import TransformConfig
+from typing import TYPE_CHECKING
+
 from pipeflow.transforms.base import Transform
 
+if TYPE_CHECKING:
+    from pipeflow.config import TransformConfig
+
+
+def build_transforms(
+    configs: list[TransformConfig], reuse_records: bool = False
+) -> list[Transform]:
+    """Factory: build a list of transforms from config.
 
-def build_transforms(configs: list[TransformConfig]) -> list[Transform]:
-    """Factory: build a list of transforms from config."""
+    With *reuse_records*, no transform copies a record it is handed; each
+    one updates or passes on the incoming dict as if ``in_place`` were set.
+    """
     from pipeflow.transforms.rename import RenameTransform
     from pipeflow.transforms.cast import CastTransform
     from pipeflow.transforms.filter import FilterTransform
@@ -16,20 +26,25 @@ def build_transforms(configs: list[TransformConfig]) -> list[Transform]:
 
     transforms: list[Transform] = []
     for cfg in configs:
+        in_place = cfg.in_place or reuse_records
         match cfg.type:
             case "rename":
-                transforms.append(RenameTransform(mapping=cfg.mapping or {}))
+                transforms.append(RenameTransform(mapping=cfg.mapping or {}, copy=not reuse_records))
             case "cast":
-                transforms.append(CastTransform(columns=cfg.columns or {}))
+                transforms.append(
+                    CastTransform(columns=cfg.columns or {}, copy=not in_place)
+                )
             case "filter":
                 transforms.append(FilterTransform(condition=cfg.condition or "True"))
             case "derive":
-                transforms.append(DeriveTransform(expression=cfg.expression or ""))
+                transforms.append(
+                    DeriveTransform(expression=cfg.expression or "", copy=not in_place)
+                )
             case "deduplicate":
                 key = cfg.key or []
                 if isinstance(key, str):
                     key = [key]
-                transforms.append(DeduplicateTransform(key=key))
+                transforms.append(DeduplicateTransform(key=key, hashed=cfg.hashed))
             case _:
                 raise ValueError(f"Unknown transform type: {cfg.type}")
     return transforms
\ No newline at end of file
@@ -1,8 +1,9 @@
-"""Transform protocol — all transforms implement this interface."""
+"""Transform protocols — all transforms implement ``Transform``."""
 
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol, runtime_checkable
 
 from pipeflow.types import Record
 
@@ -13,3 +14,66 @@ class Transform(Protocol):
     def apply(self, record: Record) -> Record | None:
         """Apply the transform to a single record."""
         ...
+
+
+@runtime_checkable
+class BatchTransform(Protocol):
+    """Optional protocol for transforms that process a whole batch per call.
+
+    One call per batch replaces a method call per record, and lets the
+    transform hoist attribute lookups and run its inner loop as a
+    comprehension.
+    """
+
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        """Transform *records* and return the ones that were kept, in order."""
+        ...
+
+
+BatchStage = Callable[[list[Record]], list[Record]]
+
+
+def _fuse(applies: list[Callable[[Record], Record | None]]) -> BatchStage:
+    """Generate one straight-line loop calling each ``apply`` in turn.
+
+    A record dropped by any step skips the rest, and no intermediate lists
+    are built between steps.
+    """
+    lines = [
+        "def fused(records):",
+        "    out = []",
+        "    append = out.append",
+        "    for record in records:",
+    ]
+    for i in range(len(applies)):
+        lines.append(f"        record = apply_{i}(record)")
+        lines.append("        if record is None:")
+        lines.append("            continue")
+    lines.append("        append(record)")
+    lines.append("    return out")
+    namespace: dict[str, Any] = {f"apply_{i}": apply for i, apply in enumerate(applies)}
+    # Fixed template; the applies are bound through the namespace, not the source.
+    exec(compile("\n".join(lines), "<fused transforms>", "exec"), namespace)  # noqa: S102
+    fused: BatchStage = namespace["fused"]
+    return fused
+
+
+def build_stages(transforms: Sequence[Transform]) -> list[BatchStage]:
+    """Resolve a transform chain into batch stages.
+
+    Transforms with ``apply_batch`` become their own stage; each run of
+    consecutive per-record-only transforms is fused into a single stage.
+    """
+    stages: list[BatchStage] = []
+    pending: list[Callable[[Record], Record | None]] = []
+    for transform in transforms:
+        if isinstance(transform, BatchTransform):
+            if pending:
+                stages.append(_fuse(pending))
+                pending = []
+            stages.append(transform.apply_batch)
+        else:
+            pending.append(transform.apply)
+    if pending:
+        stages.append(_fuse(pending))
+    return stages
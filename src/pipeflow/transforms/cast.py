@@ -2,27 +2,58 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
+from typing import Any
+
 from pipeflow.lib.types import CAST_MAP
 from pipeflow.types import Record
 
 
 class CastTransform:
-    """Cast column values to specified types."""
+    """Cast column values to specified types.
+
+    With ``copy=False`` the incoming record is updated in place instead of
+    being copied first; use it when nothing else holds on to the source
+    record.
+    """
 
-    def __init__(self, columns: dict[str, str]) -> None:
+    def __init__(self, columns: dict[str, str], copy: bool = True) -> None:
         self.columns = columns  # column_name -> type_name
+        self.copy = copy
+        self._casters: list[tuple[str, str, Callable[[Any], Any]]] = []
+        for col, type_name in columns.items():
+            caster = CAST_MAP.get(type_name)
+            if caster is None:
+                raise ValueError(f"Unknown cast type: {type_name}")
+            self._casters.append((sys.intern(col), type_name, caster))
 
     def apply(self, record: Record) -> Record:
-        result = dict(record)
-        for col, type_name in self.columns.items():
-            if col in result and result[col] is not None:
-                caster = CAST_MAP.get(type_name)
-                if caster is None:
-                    raise ValueError(f"Unknown cast type: {type_name}")
+        result = dict(record) if self.copy else record
+        for col, type_name, caster in self._casters:
+            value = result.get(col)
+            if value is None:
+                continue
+            try:
+                result[col] = caster(value)
+            except (ValueError, TypeError) as e:
+                raise ValueError(
+                    f"Cannot cast column '{col}' value {value!r} to {type_name}: {e}"
+                ) from e
+        return result
+
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        """Cast a batch column by column."""
+        batch = [dict(record) for record in records] if self.copy else records
+        for col, type_name, caster in self._casters:
+            for record in batch:
+                value = record.get(col)
+                if value is None:
+                    continue
                 try:
-                    result[col] = caster(result[col])
+                    record[col] = caster(value)
                 except (ValueError, TypeError) as e:
                     raise ValueError(
-                        f"Cannot cast column '{col}' value {result[col]!r} to {type_name}: {e}"
+                        f"Cannot cast column '{col}' value {value!r} to {type_name}: {e}"
                     ) from e
-        return result
+        return batch
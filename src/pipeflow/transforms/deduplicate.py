@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
+from operator import itemgetter
 from typing import Any
 
 from pipeflow.types import Record
@@ -10,22 +13,97 @@ from pipeflow.types import Record
 class DeduplicateTransform:
     """Remove duplicate records based on one or more key columns.
 
-    Keeps the first occurrence of each unique key combination.
+    Keeps the first occurrence of each unique key combination.  Missing key
+    columns count as None.
+
+    With ``hashed=True`` only a 64-bit digest of each key's ``repr`` is kept
+    (xxh3 when ``xxhash`` is installed, else blake2b), so memory stays
+    constant per key no matter how wide it is.  Bools and integral floats are
+    first normalised to ints so that, as in exact mode, ``1``, ``1.0`` and
+    ``True`` are the same key; other values that compare equal across types
+    (e.g. ``Decimal(1)``) are told apart.  Two distinct keys sharing a digest
+    would make the second record look like a duplicate; at 10M keys the odds
+    of any such collision are about 3 in a million.
     """
 
-    def __init__(self, key: list[str]) -> None:
-        self.key = key
+    def __init__(self, key: list[str], hashed: bool = False) -> None:
+        if not key:
+            raise ValueError("Deduplicate requires at least one key column")
+        self.key = [sys.intern(k) for k in key]
+        # One C-level call per record: a bare value for a single key column,
+        # a tuple for several.
+        self._getter = itemgetter(*self.key)
         # Seen keys grow unboundedly — intentional for correctness.
         # For very large datasets, consider adding an LRU eviction strategy.
-        self._seen: set[tuple[Any, ...]] = set()
+        self._seen: set[Any] = set()
+        self.hashed = hashed
+        self._digest = _digest_function() if hashed else None
+
+    def _key_of(self, record: Record) -> Any:
+        try:
+            return self._getter(record)
+        except KeyError:
+            if len(self.key) == 1:
+                return None
+            return tuple([record.get(k) for k in self.key])
+
+    def _hashed_key_of(self, record: Record) -> int:
+        assert self._digest is not None
+        key_values = self._key_of(record)
+        if len(self.key) == 1:
+            key_values = _canonical(key_values)
+        else:
+            key_values = tuple([_canonical(v) for v in key_values])
+        return self._digest(repr(key_values).encode())
 
     def apply(self, record: Record) -> Record | None:
-        key_values = tuple(record.get(k) for k in self.key)
+        key_values = self._hashed_key_of(record) if self.hashed else self._key_of(record)
         if key_values in self._seen:
             return None
         self._seen.add(key_values)
         return record
 
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        if self.hashed:
+            return [record for record in records if self.apply(record) is not None]
+        seen = self._seen
+        getter = self._getter
+        key_of = self._key_of
+        kept: list[Record] = []
+        for record in records:
+            try:
+                key_values = getter(record)
+            except KeyError:
+                key_values = key_of(record)
+            if key_values not in seen:
+                seen.add(key_values)
+                kept.append(record)
+        return kept
+
     def reset(self) -> None:
         """Reset seen keys for reuse."""
         self._seen.clear()
+
+
+def _canonical(value: Any) -> Any:
+    """Map bools and integral floats to the int they compare equal to."""
+    if type(value) is bool:
+        return int(value)
+    if type(value) is float and value.is_integer():
+        return int(value)
+    return value
+
+
+def _digest_function() -> Callable[[bytes], int]:
+    """Return a bytes -> 64-bit int hash, preferring xxhash's xxh3."""
+    try:
+        import xxhash
+    except ImportError:
+        from hashlib import blake2b
+
+        def digest(data: bytes) -> int:
+            return int.from_bytes(blake2b(data, digest_size=8).digest())
+
+        return digest
+    xxh3: Callable[[bytes], int] = xxhash.xxh3_64_intdigest
+    return xxh3
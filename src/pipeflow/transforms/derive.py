@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pipeflow.lib.safe_eval import safe_eval
+import sys
+
+from pipeflow.lib.safe_eval import compile_expression
 from pipeflow.types import Record
 
 
@@ -10,20 +12,39 @@ class DeriveTransform:
     """Compute a new column from an expression.
 
     Expression format: "new_col = expr" where expr uses record field names.
-    Uses a restricted AST-based evaluator with only record values in scope.
+    Uses a restricted AST-based evaluator with only record values in scope;
+    the expression is validated and compiled once, when the transform is built.
+    With ``copy=False`` the new column is written into the incoming record.
     """
 
-    def __init__(self, expression: str) -> None:
-        if "=" not in expression:
+    def __init__(self, expression: str, copy: bool = True) -> None:
+        target, sep, expr = expression.partition("=")
+        if not sep:
             raise ValueError(f"Derive expression must contain '=': {expression!r}")
-        parts = expression.split("=", 1)
-        self.target = parts[0].strip()
-        self.expr = parts[1].strip()
+        self.target = sys.intern(target.strip())
+        self.expr = expr.strip()
+        self.copy = copy
+        try:
+            self._evaluate = compile_expression(self.expr)
+        except ValueError as e:
+            raise ValueError(f"Invalid derive expression {self.expr!r}: {e}") from e
 
     def apply(self, record: Record) -> Record:
-        result = dict(record)
+        result = dict(record) if self.copy else record
         try:
-            result[self.target] = safe_eval(self.expr, result)
+            result[self.target] = self._evaluate(result)
         except Exception as e:
             raise ValueError(f"Failed to evaluate derive expression {self.expr!r}: {e}") from e
         return result
+
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        batch = [dict(record) for record in records] if self.copy else records
+        target, evaluate = self.target, self._evaluate
+        try:
+            for record in batch:
+                record[target] = evaluate(record)
+        except Exception as e:
+            raise ValueError(
+                f"Failed to evaluate derive expression {self.expr!r}: {e}"
+            ) from e
+        return batch
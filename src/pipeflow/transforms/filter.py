@@ -2,25 +2,39 @@
 
 from __future__ import annotations
 
-from pipeflow.lib.safe_eval import safe_eval
+from pipeflow.lib.safe_eval import compile_expression
 from pipeflow.types import Record
 
 
 class FilterTransform:
     """Filter records using a boolean expression.
 
-    Uses a restricted AST-based evaluator with record values in scope.
+    Uses a restricted AST-based evaluator with record values in scope; the
+    condition is validated and compiled once, when the transform is built.
     Returns None for records that don't match the condition.
     """
 
     def __init__(self, condition: str) -> None:
         self.condition = condition
+        try:
+            self._evaluate = compile_expression(condition)
+        except ValueError as e:
+            raise ValueError(f"Invalid filter condition {condition!r}: {e}") from e
 
     def apply(self, record: Record) -> Record | None:
         try:
-            result = safe_eval(self.condition, record)
+            result = self._evaluate(record)
         except Exception as e:
             raise ValueError(
                 f"Failed to evaluate filter condition {self.condition!r}: {e}"
             ) from e
         return record if result else None
+
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        evaluate = self._evaluate
+        try:
+            return [record for record in records if evaluate(record)]
+        except Exception as e:
+            raise ValueError(
+                f"Failed to evaluate filter condition {self.condition!r}: {e}"
+            ) from e
@@ -2,14 +2,40 @@
 
 from __future__ import annotations
 
+import sys
+
 from pipeflow.types import Record
 
 
 class RenameTransform:
-    """Rename record keys based on a mapping."""
+    """Rename record keys based on a mapping.
+
+    Key order is preserved.  Records containing none of the mapped keys are
+    copied with ``dict()`` instead of being rebuilt key by key, or passed
+    through untouched with ``copy=False``.
+    """
 
-    def __init__(self, mapping: dict[str, str]) -> None:
-        self.mapping = mapping  # old_name -> new_name
+    def __init__(self, mapping: dict[str, str], copy: bool = True) -> None:
+        self.mapping = {  # old_name -> new_name
+            sys.intern(old): sys.intern(new) for old, new in mapping.items()
+        }
+        self.copy = copy
 
     def apply(self, record: Record) -> Record:
-        return {self.mapping.get(k, k): v for k, v in record.items()}
+        if self.mapping.keys().isdisjoint(record):
+            return dict(record) if self.copy else record
+        get = self.mapping.get
+        return {get(k, k): v for k, v in record.items()}
+
+    def apply_batch(self, records: list[Record]) -> list[Record]:
+        get = self.mapping.get
+        untouched = self.mapping.keys().isdisjoint
+        if not self.copy:
+            return [
+                record if untouched(record) else {get(k, k): v for k, v in record.items()}
+                for record in records
+            ]
+        return [
+            dict(record) if untouched(record) else {get(k, k): v for k, v in record.items()}
+            for record in records
+        ]
@@ -2,44 +2,155 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Hashable, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, ValidationError, create_model
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
 
 from pipeflow.config import ValidateConfig
 from pipeflow.lib.types import TYPE_MAP
 from pipeflow.types import Record
 
+# Exact value types the lax pydantic model accepts as-is for each type name.
+_ACCEPTED_TYPES: dict[Any, frozenset[type]] = {
+    int: frozenset({int, bool}),
+    float: frozenset({float, int, bool}),
+    str: frozenset({str}),
+    bool: frozenset({bool}),
+    datetime: frozenset({datetime}),
+}
+
+# (field name, exact types accepted) pairs checked before calling pydantic.
+FieldChecks = Sequence[tuple[str, frozenset[type]]]
+
 
 class RecordValidator:
-    """Validates records against a dynamically-built Pydantic model."""
+    """Validates records against a dynamically-built Pydantic model.
+
+    When *checks* are given, records whose every field has one of the listed
+    exact types are accepted without calling pydantic; the rest (and their
+    error messages) still go through the model.
+    """
 
-    def __init__(self, model: type[BaseModel]) -> None:
+    def __init__(self, model: type[BaseModel], checks: FieldChecks | None = None) -> None:
         self.model = model
+        self.checks = checks
+        self._list_adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    def _accepts(self, record: Record) -> bool:
+        """True when the plain type checks alone show *record* is valid."""
+        checks = self.checks
+        if checks is None or type(record) is not dict:
+            return False
+        get = record.get
+        for name, types in checks:
+            if type(get(name)) not in types:
+                return False
+        return True
 
     def validate_record(self, record: Record) -> list[dict[str, Any]]:
         """Validate a single record. Returns list of errors (empty if valid)."""
+        if self._accepts(record):
+            return []
         try:
             self.model.model_validate(record)
             return []
         except ValidationError as e:
-            return [
-                {
-                    "field": ".".join(str(loc) for loc in err["loc"]),
-                    "message": err["msg"],
-                    "type": err["type"],
-                }
-                for err in e.errors()
-            ]
+            return [_describe(err, err["loc"]) for err in e.errors()]
+
+    def validate_batch(self, records: list[Record]) -> list[list[dict[str, Any]]]:
+        """Validate a batch in one pydantic call.
+
+        Returns one error list per record, in order (empty if valid).
+        """
+        result: list[list[dict[str, Any]]] = [[] for _ in records]
+        pending: Sequence[int]
+        if self.checks is None:
+            pending = range(len(records))
+            subset = records
+        else:
+            accepts = self._accepts
+            pending = [i for i, record in enumerate(records) if not accepts(record)]
+            if not pending:
+                return result
+            subset = [records[i] for i in pending]
+        try:
+            self._list_adapter.validate_python(subset)
+        except ValidationError as e:
+            # Locations start with the record's index within the subset.
+            for err in e.errors():
+                index, *loc = err["loc"]
+                result[pending[int(index)]].append(_describe(err, loc))
+        return result
+
+
+def _describe(err: Any, loc: Sequence[Any]) -> dict[str, Any]:
+    return {
+        "field": ".".join(str(part) for part in loc),
+        "message": err["msg"],
+        "type": err["type"],
+    }
+
+
+# Validators by config key.  Building a pydantic model (and its core schema)
+# costs far more than validating with it, and validators hold no per-run
+# state, so pipelines with the same validate config share one.
+_VALIDATORS: dict[Hashable, RecordValidator] = {}
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+class ValidatorCacheInfo(NamedTuple):
+    """Snapshot of the shared validator cache, like ``functools`` cache_info."""
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+def _config_key(config: ValidateConfig) -> Hashable:
+    fields = config.fields or {}
+    return (
+        config.model,
+        tuple(sorted((name, tuple(sorted(spec.items()))) for name, spec in fields.items())),
+    )
 
 
 def build_validator(config: ValidateConfig) -> RecordValidator:
-    """Build a RecordValidator from config.
+    """Build a RecordValidator from config, reusing one built for an equal config.
 
     If config.fields is provided, dynamically creates a Pydantic model.
     """
+    try:
+        key = _config_key(config)
+        hash(key)
+    except TypeError:  # unhashable field spec values: build without caching
+        return _build_validator(config)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        _cache_stats["misses"] += 1
+        validator = _VALIDATORS[key] = _build_validator(config)
+    else:
+        _cache_stats["hits"] += 1
+    return validator
+
+
+def validator_cache_info() -> ValidatorCacheInfo:
+    """Report hits, misses and size of the cache used by ``build_validator``."""
+    return ValidatorCacheInfo(_cache_stats["hits"], _cache_stats["misses"], len(_VALIDATORS))
+
+
+def clear_validator_cache() -> None:
+    """Forget all shared validators and reset the hit/miss counters."""
+    _VALIDATORS.clear()
+    _cache_stats["hits"] = _cache_stats["misses"] = 0
+
+
+def _build_validator(config: ValidateConfig) -> RecordValidator:
     if config.fields:
         field_definitions: dict[str, Any] = {}
+        # Plain type checks only stand in for specs limited to type/required.
+        checks: list[tuple[str, frozenset[type]]] | None = []
         for field_name, field_spec in config.fields.items():
             field_type_str = field_spec.get("type", "str")
             field_type = TYPE_MAP.get(field_type_str, str)
@@ -48,10 +159,15 @@ def build_validator(config: ValidateConfig) -> RecordValidator:
                 field_definitions[field_name] = (field_type, ...)
             else:
                 field_definitions[field_name] = (field_type | None, None)
+            types = _ACCEPTED_TYPES.get(field_type)
+            if checks is not None and types and field_spec.keys() <= {"type", "required"}:
+                checks.append((field_name, types if required else types | {type(None)}))
+            else:
+                checks = None
 
         model = create_model(config.model, **field_definitions)
-        return RecordValidator(model=model)
+        return RecordValidator(model=model, checks=checks)
 
     # Fallback: create a permissive model that accepts any fields
     model = create_model(config.model, __base__=BaseModel)
-    return RecordValidator(model=model)
+    return RecordValidator(model=model, checks=[])
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import io
 import json
 from unittest.mock import MagicMock, patch
 from typing import Any
 
+import pytest
+
 from pipeflow.extractors.api import APIExtractor
 
 
@@ -13,7 +16,9 @@ def _mock_response(data: Any, headers: dict[str, str] | None = None) -> MagicMoc
     """Create a mock HTTP response."""
     body = json.dumps(data).encode("utf-8")
     resp = MagicMock()
-    resp.read.return_value = body
+    stream = io.BytesIO(body)
+    resp.read.side_effect = stream.read
+    resp.readinto.side_effect = stream.readinto
     resp.__enter__ = lambda s: s
     resp.__exit__ = MagicMock(return_value=False)
     mock_headers = MagicMock()
@@ -93,3 +98,111 @@ class TestAPIExtractor:
         list(ext.extract())
         called_req = mock_urlopen.call_args[0][0]
         assert called_req.get_header("Authorization") == "Bearer token123"
+
+    @patch("pipeflow.extractors.api.urllib.request.urlopen")
+    def test_offset_pagination(self, mock_urlopen: MagicMock) -> None:
+        mock_urlopen.side_effect = [
+            _mock_response([{"id": 1}, {"id": 2}]),
+            _mock_response([{"id": 3}, {"id": 4}]),
+            _mock_response([{"id": 5}]),
+        ]
+        ext = APIExtractor(
+            url="https://api.example.com/users",
+            params={"status": "active"},
+            pagination={"type": "offset", "limit": 2},
+        )
+        records = list(ext.extract())
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+        urls = [c[0][0].full_url for c in mock_urlopen.call_args_list]
+        assert urls[1] == "https://api.example.com/users?status=active&offset=2&limit=2"
+        assert urls[2] == "https://api.example.com/users?status=active&offset=4&limit=2"
+
+    @patch("pipeflow.extractors.api.urllib.request.urlopen")
+    def test_offset_param_untouched_without_offset_pagination(
+        self, mock_urlopen: MagicMock
+    ) -> None:
+        mock_urlopen.return_value = _mock_response([{"id": 1}])
+        ext = APIExtractor(url="https://api.example.com/users?offset=abc")
+        assert [r["id"] for r in ext.extract()] == [1]
+        called_req = mock_urlopen.call_args[0][0]
+        assert called_req.full_url == "https://api.example.com/users?offset=abc"
+
+    @patch("pipeflow.extractors.api.urllib.request.urlopen")
+    def test_streamed_records_key(self, mock_urlopen: MagicMock) -> None:
+        pytest.importorskip("ijson")
+        mock_urlopen.side_effect = [
+            _mock_response({"results": [{"id": 1, "score": 1.5}, {"id": 2}]}),
+            _mock_response({"results": [{"id": 3}], "total": 3}),
+        ]
+        ext = APIExtractor(
+            url="https://api.example.com/users",
+            pagination={"type": "offset", "limit": 2, "records_key": "results"},
+        )
+        records = list(ext.extract())
+        assert [r["id"] for r in records] == [1, 2, 3]
+        assert isinstance(records[0]["score"], float)
+        assert mock_urlopen.call_count == 2
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            [{"id": 1}, {"id": 2}],
+            {"data": [{"id": 1}], "total": 1},
+            {"results": None},
+            {"meta": {"results": [{"id": 9}]}, "results": {"item": {"id": 8}}},
+        ],
+    )
+    @patch("pipeflow.extractors.api.urllib.request.urlopen")
+    def test_streaming_matches_buffered_for_other_shapes(
+        self, mock_urlopen: MagicMock, page: Any
+    ) -> None:
+        pytest.importorskip("ijson")
+        pagination = {"records_key": "results"}
+        mock_urlopen.return_value = _mock_response(page)
+        streamed = list(APIExtractor(url="https://x/", pagination=pagination).extract())
+
+        mock_urlopen.return_value = _mock_response(page)
+        with patch("pipeflow.extractors.api._ijson_available", return_value=False):
+            buffered = list(APIExtractor(url="https://x/", pagination=pagination).extract())
+        assert streamed == buffered
+        assert streamed == (page if isinstance(page, list) else [page])
+
+    @patch("pipeflow.extractors.api.urllib.request.urlopen")
+    def test_streamed_page_follows_body_next_link(self, mock_urlopen: MagicMock) -> None:
+        pytest.importorskip("ijson")
+        mock_urlopen.side_effect = [
+            _mock_response({"results": [{"id": 1}, 2], "next": "https://x/?page=2"}),
+            _mock_response({"results": [{"id": 3}]}),
+        ]
+        ext = APIExtractor(url="https://x/", pagination={"records_key": "results"})
+        assert list(ext.extract()) == [{"id": 1}, 2, {"id": 3}]
+        assert mock_urlopen.call_args[0][0].full_url == "https://x/?page=2"
+
+    def test_parse_link_header(self) -> None:
+        header = (
+            '<https://api.example.com/users?page=1>; rel="prev", '
+            "<https://api.example.com/users?page=3>; rel='next'"
+        )
+        assert APIExtractor._parse_link_header(header) == "https://api.example.com/users?page=3"
+        assert APIExtractor._parse_link_header('<https://x/1>; rel="last"') is None
+
+    @patch("urllib3.PoolManager")
+    def test_keep_alive_reuses_pool(self, mock_pool_cls: MagicMock) -> None:
+        pool = mock_pool_cls.return_value
+        pages = [_mock_response([{"id": 1}, {"id": 2}]), _mock_response([{"id": 3}])]
+        for page in pages:
+            page.status = 200
+        pool.request.side_effect = pages
+
+        ext = APIExtractor(
+            url="https://api.example.com/users",
+            pagination={"type": "offset", "limit": 2},
+            keep_alive=True,
+        )
+        assert [r["id"] for r in ext.extract()] == [1, 2, 3]
+        assert mock_pool_cls.call_count == 1
+        assert pool.request.call_count == 2
+        for page in pages:
+            page.release_conn.assert_called_once()
+        ext.close()
+        pool.clear.assert_called_once()
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import csv
+import os
 import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from pipeflow.cli import main
 
 
@@ -76,10 +81,40 @@ class TestCLIInspect:
         result = main(["inspect", str(sample_csv)])
         assert result == 0
 
+    def test_inspect_csv_counts_all_rows(
+        self, sample_csv: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        result = main(["inspect", str(sample_csv), "-n", "2"])
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Total rows: 5" in out
+        assert "Sample (2 rows):" in out
+
+    def test_inspect_csv_quoted_newlines(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        p = tmp_path / "notes.csv"
+        p.write_text('id,note\n1,"line one\nline two"\n2,plain\n3,"a\nb"\n')
+        assert main(["inspect", str(p), "-n", "1"]) == 0
+        out = capsys.readouterr().out
+        assert "Total rows: 3" in out
+        assert "Sample (1 rows):" in out
+
     def test_inspect_json(self, sample_json: Path) -> None:
         result = main(["inspect", str(sample_json)])
         assert result == 0
 
+    def test_inspect_jsonl_counts_all_records(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        p = tmp_path / "data.jsonl"
+        p.write_text("".join(f'{{"id": {i}}}\n' for i in range(10)) + "\n")
+        result = main(["inspect", str(p), "-n", "3"])
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Total records: 10" in out
+        assert "Sample (3 records):" in out
+
     def test_inspect_missing_file(self) -> None:
         result = main(["inspect", "/nonexistent/file.csv"])
         assert result == 1
@@ -87,3 +122,11 @@ class TestCLIInspect:
     def test_no_command(self) -> None:
         result = main([])
         assert result == 1
+
+    def test_cli_import_skips_config_dependencies(self) -> None:
+        code = "import sys, pipeflow.cli; print('pydantic' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert out.stdout.strip() == "False"
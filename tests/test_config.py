@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
-from pipeflow.config import load_config
+from pipeflow.config import clear_config_cache, load_config, load_config_header
 
 
 def _write_yaml(tmp_path: Path, content: str) -> Path:
@@ -76,6 +77,61 @@ load:
         assert config.load.mode == "upsert"
         assert config.load.batch_size == 50
 
+    def test_cache_reuses_unchanged_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import pipeflow.config as config_module
+
+        parsed: list[Path] = []
+        parse = config_module._parse_config
+        monkeypatch.setattr(
+            config_module, "_parse_config", lambda p: parsed.append(p) or parse(p)
+        )
+        clear_config_cache()
+        path = _write_yaml(tmp_path, "name: a\nextract: {type: csv}\nload: {type: csv}\n")
+        load_config(path)
+        load_config(str(path))
+        assert len(parsed) == 1
+
+        path.write_text("name: b\nextract: {type: csv}\nload: {type: csv}\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config(path).name == "b"
+        assert len(parsed) == 2
+
+        clear_config_cache()
+        load_config(path)
+        assert len(parsed) == 3
+
+    def test_cached_config_is_not_shared(self, tmp_path: Path) -> None:
+        path = _write_yaml(tmp_path, "name: a\nextract: {type: csv}\nload: {type: csv}\n")
+        first = load_config(path)
+        first.load.batch_size = 7
+        first.extract.headers["X-Token"] = "secret"
+        again = load_config(path)
+        assert again is not first
+        assert again.load.batch_size == 100
+        assert again.extract.headers == {}
+
+    def test_cache_is_bounded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import pipeflow.config as config_module
+
+        monkeypatch.setattr(config_module, "_CACHE_SIZE", 2)
+        clear_config_cache()
+        paths = []
+        for i in range(3):
+            p = tmp_path / f"p{i}.yaml"
+            p.write_text(f"name: p{i}\nextract: {{type: csv}}\nload: {{type: csv}}\n")
+            paths.append(p)
+        load_config(paths[0])
+        load_config(paths[1])
+        load_config(paths[0])  # refreshes p0
+        load_config(paths[2])  # evicts p1, the least recently used
+        cached = {config.name for config in config_module._CACHE.values()}
+        assert cached == {"p0", "p2"}
+
     def test_missing_file(self) -> None:
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/pipeline.yaml")
@@ -93,6 +149,39 @@ name: bad_pipeline
         with pytest.raises(Exception):
             load_config(path)
 
+    @pytest.mark.parametrize("batch_size", [0, -5])
+    def test_non_positive_batch_size_rejected(self, tmp_path: Path, batch_size: int) -> None:
+        yaml_text = f"""
+name: bad_batch
+extract:
+  type: csv
+  path: ./data.csv
+load:
+  type: csv
+  path: ./out.csv
+  batch_size: {batch_size}
+"""
+        path = _write_yaml(tmp_path, yaml_text)
+        with pytest.raises(ValueError, match="batch_size"):
+            load_config(path)
+
+    def test_negative_max_errors_rejected(self, tmp_path: Path) -> None:
+        yaml_text = """
+name: bad_errors
+extract:
+  type: csv
+  path: ./data.csv
+validate:
+  model: Row
+  max_errors: -1
+load:
+  type: csv
+  path: ./out.csv
+"""
+        path = _write_yaml(tmp_path, yaml_text)
+        with pytest.raises(ValueError, match="max_errors"):
+            load_config(path)
+
     def test_default_values(self, tmp_path: Path) -> None:
         yaml_text = """
 name: defaults
@@ -109,3 +198,36 @@ load:
         assert config.extract.encoding == "utf-8"
         assert config.load.mode == "insert"
         assert config.load.batch_size == 100
+
+
+class TestLoadConfigHeader:
+    def test_drops_sections_past_the_limit(self, tmp_path: Path) -> None:
+        yaml_text = (
+            "name: big\n"
+            "extract:\n  type: csv\n  path: ./data.csv\n"
+            "load: {type: csv, path: out.csv}\n"
+            "transforms:\n" + "  - type: filter\n    condition: 'x > 1'\n" * 50
+        )
+        path = _write_yaml(tmp_path, yaml_text)
+        header = load_config_header(path, max_lines=10)
+        assert header == {
+            "name": "big",
+            "extract": {"type": "csv", "path": "./data.csv"},
+            "load": {"type": "csv", "path": "out.csv"},
+        }
+        assert len(load_config_header(path, max_lines=1000)["transforms"]) == 50
+
+    def test_falls_back_to_full_parse(self, tmp_path: Path) -> None:
+        path = _write_yaml(tmp_path, "{name: flow,\n extract: {type: csv},\n load: {type: csv}}\n")
+        assert load_config_header(path, max_lines=1)["name"] == "flow"
+
+    def test_malformed_short_file_raises_parse_error(self, tmp_path: Path) -> None:
+        import yaml
+
+        path = _write_yaml(tmp_path, "name: [unclosed\nextract: {type: csv}\n")
+        with pytest.raises(yaml.YAMLError):
+            load_config_header(path)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_config_header(tmp_path / "nope.yaml")
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from pipeflow.config import ExtractConfig
+from pipeflow.extractors import build_extractor
 from pipeflow.extractors.csv_ext import CSVExtractor
 from pipeflow.extractors.json_ext import JSONExtractor
 
@@ -30,6 +34,37 @@ class TestCSVExtractor:
         assert len(records) == 2
         assert records[0] == {"a": "1", "b": "2"}
 
+    def test_ragged_rows_match_dictreader(self, tmp_path: Path) -> None:
+        p = tmp_path / "ragged.csv"
+        p.write_text("a,b\n1\n\n1,2,3\n", encoding="utf-8")
+        records = list(CSVExtractor(path=str(p)).extract())
+        assert records == [{"a": "1", "b": None}, {"a": "1", "b": "2", None: ["3"]}]
+
+    def test_arrow_engine_matches_stdlib(self, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        p = tmp_path / "data.csv"
+        p.write_text('id;note\n1;"multi\nline"\n2;\n\n3;plain\n', encoding="utf-8")
+        stdlib = list(CSVExtractor(path=str(p), delimiter=";").extract())
+        arrow = list(CSVExtractor(path=str(p), delimiter=";", engine="arrow").extract())
+        assert arrow == stdlib
+        assert arrow[1] == {"id": "2", "note": ""}
+
+    def test_unknown_engine(self) -> None:
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            CSVExtractor(path="data.csv", engine="fast")
+
+    def test_batch_extract(self, sample_csv: Path) -> None:
+        ext = CSVExtractor(path=str(sample_csv))
+        batches = list(ext.batch_extract(2))
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert [r for b in batches for r in b] == list(ext.extract())
+
+    def test_arrow_batch_extract(self, sample_csv: Path) -> None:
+        pytest.importorskip("pyarrow")
+        ext = CSVExtractor(path=str(sample_csv), engine="arrow")
+        records = [r for b in ext.batch_extract(2) for r in b]
+        assert records == list(CSVExtractor(path=str(sample_csv)).extract())
+
     def test_streaming_generator(self, sample_csv: Path) -> None:
         ext = CSVExtractor(path=str(sample_csv))
         gen = ext.extract()
@@ -51,6 +86,18 @@ class TestJSONExtractor:
         assert records[0]["name"] == "Alice"
         assert records[1]["score"] == 87
 
+    def test_batch_extract(self, sample_json: Path, sample_jsonl: Path) -> None:
+        ext = JSONExtractor(path=str(sample_json), format="json")
+        assert [len(b) for b in ext.batch_extract(2)] == [2, 1]
+        ext = JSONExtractor(path=str(sample_jsonl), format="jsonl")
+        assert [len(b) for b in ext.batch_extract(2)] == [2]
+
+    def test_empty_json_file(self, tmp_path: Path) -> None:
+        p = tmp_path / "empty.json"
+        p.write_bytes(b"")
+        with pytest.raises(ValueError):
+            list(JSONExtractor(path=str(p), format="json").extract())
+
     def test_single_json_object(self, tmp_path: Path) -> None:
         import json
         p = tmp_path / "single.json"
@@ -60,9 +107,49 @@ class TestJSONExtractor:
         assert len(records) == 1
         assert records[0]["key"] == "value"
 
+    def test_large_array_streams_with_ijson(self, tmp_path: Path) -> None:
+        pytest.importorskip("ijson")
+        import json
+        p = tmp_path / "large.json"
+        rows = [{"id": i, "score": i / 2, "tags": ["a"]} for i in range(5)]
+        p.write_text(" \n" + json.dumps(rows))
+        ext = JSONExtractor(path=str(p), format="json", stream_threshold=16)
+        assert ext._should_stream()
+        assert list(ext.extract()) == rows
+        assert [len(b) for b in ext.batch_extract(2)] == [2, 2, 1]
+
+    def test_large_object_is_not_streamed(self, tmp_path: Path) -> None:
+        import json
+        p = tmp_path / "single.json"
+        p.write_text(json.dumps({"key": "value" * 10}))
+        ext = JSONExtractor(path=str(p), format="json", stream_threshold=16)
+        assert not ext._should_stream()
+        assert list(ext.extract()) == [{"key": "value" * 10}]
+
+    def test_share_keys_interns_column_names(self) -> None:
+        import sys
+
+        from pipeflow.extractors.json_ext import _share_keys
+        name = b"name".decode()  # a fresh, non-interned str
+        records = [{name: "a", "id": 1}, {"id": 2}, [1], {name: "c", "id": 3}]
+        out = list(_share_keys(iter(records)))
+        assert out == records
+        assert next(iter(out[0])) is sys.intern("name")
+        assert next(iter(out[3])) is next(iter(out[0]))
+
     def test_jsonl_empty_lines(self, tmp_path: Path) -> None:
         p = tmp_path / "sparse.jsonl"
         p.write_text('{"a": 1}\n\n{"b": 2}\n\n')
         ext = JSONExtractor(path=str(p), format="jsonl")
         records = list(ext.extract())
         assert len(records) == 2
+
+
+class TestBuildExtractor:
+    def test_builds_registered_type(self, sample_csv: Path) -> None:
+        ext = build_extractor(ExtractConfig(type="csv", path=str(sample_csv)))
+        assert isinstance(ext, CSVExtractor)
+
+    def test_unknown_type(self) -> None:
+        with pytest.raises(ValueError, match="Unknown extractor type: xml"):
+            build_extractor(ExtractConfig(type="xml"))
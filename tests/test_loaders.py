@@ -6,8 +6,11 @@ import csv
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 from pipeflow.loaders.sqlite import SQLiteLoader
 from pipeflow.loaders.csv_writer import CSVWriterLoader
+from pipeflow.loaders.threaded import ThreadedLoader
 
 
 class TestSQLiteLoader:
@@ -68,6 +71,65 @@ class TestSQLiteLoader:
         assert len(rows) == 1
         assert rows[0][0] == "Alice Updated"
 
+    def test_wal_pragmas(self, tmp_path: Path) -> None:
+        loader = SQLiteLoader(database=str(tmp_path / "wal.db"), table="t")
+        assert loader.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        loader.close()
+
+        loader = SQLiteLoader(database=str(tmp_path / "plain.db"), table="t", wal=False)
+        assert loader.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        loader.close()
+
+    def test_missing_columns_and_pre_serialized(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        loader = SQLiteLoader(database=db_path, table="t", pre_serialized=True)
+        loader.load([{"a": "1", "b": 2}, {"a": "3"}])
+        loader.close()
+
+        loader = SQLiteLoader(database=db_path, table="one")
+        loader.load([{"a": [1, 2]}])
+        loader.close()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT a, b FROM t").fetchall() == [("1", "2"), ("3", None)]
+        assert conn.execute("SELECT a FROM one").fetchall() == [("[1, 2]",)]
+        conn.close()
+
+    def test_commits_every_n_batches(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        loader = SQLiteLoader(database=str(db_path), table="t", commit_every=2)
+
+        def committed_rows() -> int:
+            conn = sqlite3.connect(str(db_path))
+            try:
+                return int(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+            finally:
+                conn.close()
+
+        loader.load([{"a": "1"}])
+        assert committed_rows() == 0
+        loader.load([{"a": "2"}])
+        assert committed_rows() == 2
+        loader.load([{"a": "3"}])
+        loader.close()
+        assert committed_rows() == 3
+        wal = Path(f"{db_path}-wal")
+        assert not wal.exists() or wal.stat().st_size == 0
+
+    def test_failed_batch_keeps_earlier_uncommitted_batches(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        loader = SQLiteLoader(database=db_path, table="t", commit_every=10)
+        loader.load([{"a": "1"}])
+        loader.load([{"a": "2"}])
+        with pytest.raises(sqlite3.OperationalError):
+            loader.load([{"a": "3", "missing": "x"}])
+        loader.load([{"a": "4"}])
+        loader.close()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT a FROM t").fetchall() == [("1",), ("2",), ("4",)]
+        conn.close()
+
     def test_empty_records(self, tmp_path: Path) -> None:
         db_path = str(tmp_path / "test.db")
         loader = SQLiteLoader(database=db_path, table="empty")
@@ -122,6 +184,16 @@ class TestCSVWriterLoader:
             roundtripped = [dict(row) for row in reader]
         assert roundtripped == original
 
+    def test_multiple_batches_and_ragged_records(self, tmp_path: Path) -> None:
+        out_path = tmp_path / "out.csv"
+        loader = CSVWriterLoader(path=str(out_path))
+        loader.load([{"a": "1", "b": "2"}])
+        loader.load([{"b": "4", "a": "3"}, {"a": "5"}])
+        with pytest.raises(ValueError, match="not in fieldnames"):
+            loader.load([{"a": "6", "c": "7"}])
+        loader.close()
+        assert out_path.read_text().splitlines() == ["a,b", "1,2", "3,4", "5,"]
+
     def test_empty_records(self, tmp_path: Path) -> None:
         out_path = str(tmp_path / "empty.csv")
         loader = CSVWriterLoader(path=out_path)
@@ -140,3 +212,37 @@ class TestCSVWriterLoader:
             reader = csv.DictReader(f)
             rows = list(reader)
         assert len(rows) == 2
+
+
+class TestThreadedLoader:
+    def test_writes_all_batches(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        loader = ThreadedLoader(SQLiteLoader(database=db_path, table="t"), max_pending=1)
+        queued = sum(loader.load([{"n": str(i)}, {"n": str(i)}]) for i in range(10))
+        loader.close()
+
+        assert queued == 0
+        assert loader.records_written == 20
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 20
+        conn.close()
+
+    def test_writer_error_is_reraised(self, tmp_path: Path) -> None:
+        class FailsSecond:
+            calls = 0
+
+            def load(self, records: list[object]) -> int:
+                self.calls += 1
+                if self.calls == 2:
+                    raise RuntimeError("disk full")
+                return len(records)
+
+            def close(self) -> None:
+                pass
+
+        loader = ThreadedLoader(FailsSecond())
+        loader.load([{"a": 1}, {"a": 2}])
+        loader.load([{"a": 3}])
+        with pytest.raises(RuntimeError, match="disk full"):
+            loader.close()
+        assert loader.records_written == 2
@@ -5,11 +5,14 @@ from __future__ import annotations
 import csv
 import json
 import sqlite3
+from collections.abc import Sequence
 from pathlib import Path
 
+import pytest
 
 from pipeflow.config import load_config
 from pipeflow.pipeline import Pipeline
+from pipeflow.types import Record
 
 
 class TestPipelineEndToEnd:
@@ -40,6 +43,74 @@ load:
         conn.close()
         assert len(rows) == 5
 
+    def test_loads_in_fixed_size_batches(
+        self, sample_csv: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from pipeflow.loaders.sqlite import SQLiteLoader
+
+        sizes: list[int] = []
+        original = SQLiteLoader.load
+
+        def spy(self: SQLiteLoader, records: Sequence[Record]) -> int:
+            sizes.append(len(records))
+            return original(self, records)
+
+        monkeypatch.setattr(SQLiteLoader, "load", spy)
+        config_yaml = tmp_path / "pipeline.yaml"
+        config_yaml.write_text(f"""
+name: batched
+extract:
+  type: csv
+  path: {sample_csv}
+load:
+  type: sqlite
+  database: {tmp_path / "out.db"}
+  table: users
+  batch_size: 2
+""")
+        metrics = Pipeline(load_config(config_yaml)).run()
+        assert metrics["records_loaded"] == 5
+        assert sizes == [2, 2, 1]
+
+    def test_closes_extractor(
+        self, sample_csv: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from pipeflow.extractors.csv_ext import CSVExtractor
+
+        closed: list[bool] = []
+        monkeypatch.setattr(CSVExtractor, "close", lambda self: closed.append(True), raising=False)
+        config_yaml = tmp_path / "pipeline.yaml"
+        config_yaml.write_text(f"""
+name: closing
+extract:
+  type: csv
+  path: {sample_csv}
+load:
+  type: csv
+  path: {tmp_path / "out.csv"}
+""")
+        Pipeline(load_config(config_yaml)).run()
+        assert closed == [True]
+
+    def test_background_load_counts_written_records(
+        self, sample_csv: Path, tmp_path: Path
+    ) -> None:
+        config_yaml = tmp_path / "pipeline.yaml"
+        config_yaml.write_text(f"""
+name: background
+extract:
+  type: csv
+  path: {sample_csv}
+load:
+  type: sqlite
+  database: {tmp_path / "out.db"}
+  table: users
+  batch_size: 2
+  background: true
+""")
+        metrics = Pipeline(load_config(config_yaml)).run()
+        assert metrics["records_loaded"] == 5
+
     def test_csv_with_transforms_and_validation(
         self, sample_csv: Path, tmp_path: Path
     ) -> None:
@@ -195,6 +266,37 @@ load:
             rows = list(reader)
         assert rows[0]["full_name"] == "Alice Smith"
 
+    def test_reuse_records(self, sample_csv: Path, tmp_path: Path) -> None:
+        out_csv = tmp_path / "out.csv"
+        config_yaml = tmp_path / "pipeline.yaml"
+        config_yaml.write_text(f"""
+name: reuse_pipeline
+reuse_records: true
+extract:
+  type: csv
+  path: {sample_csv}
+transforms:
+  - type: rename
+    mapping:
+      city: town
+  - type: cast
+    columns:
+      age: int
+  - type: derive
+    expression: "next_age = age + 1"
+load:
+  type: csv
+  path: {out_csv}
+""")
+        config = load_config(config_yaml)
+        assert config.reuse_records
+        metrics = Pipeline(config).run()
+
+        assert metrics["records_loaded"] == 5
+        with open(out_csv, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["town"] and int(rows[0]["next_age"]) == int(rows[0]["age"]) + 1
+
     def test_validation_rejects_bad_records(self, tmp_path: Path) -> None:
         """Records failing validation go to error list, not loaded."""
         data_json = tmp_path / "data.json"
@@ -233,6 +335,32 @@ load:
         assert metrics["records_loaded"] == 2
         assert metrics["error_count"] == 1
 
+    def test_error_samples_are_bounded(self, tmp_path: Path) -> None:
+        data_json = tmp_path / "data.json"
+        data_json.write_text(json.dumps([{"age": str(i) + "x"} for i in range(5)]))
+        config_yaml = tmp_path / "pipeline.yaml"
+        config_yaml.write_text(f"""
+name: bounded_errors
+extract:
+  type: json
+  path: {data_json}
+validate:
+  model: Record
+  max_errors: 2
+  fields:
+    age:
+      type: int
+load:
+  type: sqlite
+  database: {tmp_path / "out.db"}
+  table: records
+""")
+        pipeline = Pipeline(load_config(config_yaml))
+        metrics = pipeline.run()
+
+        assert metrics["error_count"] == 5
+        assert [e["record"] for e in pipeline.metrics.errors] == [{"age": "3x"}, {"age": "4x"}]
+
     def test_metrics_has_duration(self, sample_csv: Path, tmp_path: Path) -> None:
         db_path = tmp_path / "out.db"
         config_yaml = tmp_path / "pipeline.yaml"
@@ -0,0 +1,70 @@
+"""Tests for the restricted expression evaluator."""
+
+from __future__ import annotations
+
+import pytest
+
+from pipeflow.lib.safe_eval import safe_eval
+
+
+class TestSafeEval:
+    def test_arithmetic_and_comparison(self) -> None:
+        assert safe_eval("price * qty + 1", {"price": 2, "qty": 3}) == 7
+        assert safe_eval("1 < x <= 3", {"x": 3}) is True
+        assert safe_eval("1 < x <= 3", {"x": 4}) is False
+
+    def test_boolean_ops_short_circuit(self) -> None:
+        assert safe_eval("x or missing", {"x": 1}) == 1
+        assert safe_eval("x and missing", {"x": 0}) == 0
+
+    def test_string_methods_and_builtins(self) -> None:
+        assert safe_eval("name.upper()", {"name": "alice"}) == "ALICE"
+        assert safe_eval("len(name) + max(1, 2)", {"name": "abc"}) == 5
+        assert safe_eval("f'{a}-{b}'", {"a": 1, "b": "x"}) == "1-x"
+
+    def test_containers_and_ternary(self) -> None:
+        assert safe_eval("city in ['NYC', 'LA']", {"city": "LA"}) is True
+        assert safe_eval("{'k': v}['k']", {"v": 5}) == 5
+        assert safe_eval("'a' if x else 'b'", {"x": 0}) == "b"
+
+    def test_builtins_not_shadowed_by_variables(self) -> None:
+        assert safe_eval("len(name)", {"name": "abc", "len": 99}) == 3
+
+    def test_keyword_arguments(self) -> None:
+        assert safe_eval("round(x, ndigits=1)", {"x": 2.26}) == 2.3
+        assert safe_eval("s.split(sep='-')", {"s": "a-b"}) == ["a", "b"]
+
+    def test_undefined_name(self) -> None:
+        with pytest.raises(NameError, match="Undefined name: 'missing'"):
+            safe_eval("missing + 1", {})
+        with pytest.raises(NameError, match="Undefined name: 'missing'"):
+            safe_eval("missing if x else 0", {"x": 1})
+
+    def test_repeated_calls_see_new_variables(self) -> None:
+        assert safe_eval("x + 1", {"x": 1}) == 2
+        assert safe_eval("x + 1", {"x": 41}) == 42
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "__import__('os')",
+            "x.__class__",
+            "open('/etc/passwd')",
+            "[a for a in x]",
+            "lambda: 1",
+            "2 ** 8",
+            "__builtins__",
+            "x[1:]",
+        ],
+    )
+    def test_disallowed_constructs(self, expression: str) -> None:
+        with pytest.raises(ValueError):
+            safe_eval(expression, {"x": "abc"})
+
+    def test_method_call_on_non_string_rejected(self) -> None:
+        with pytest.raises(ValueError, match="not allowed on list"):
+            safe_eval("x.upper()", {"x": []})
+
+    def test_invalid_syntax(self) -> None:
+        with pytest.raises(ValueError, match="Invalid expression syntax"):
+            safe_eval("age >=", {})
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 
+from pipeflow.transforms.base import build_stages
 from pipeflow.transforms.rename import RenameTransform
 from pipeflow.transforms.cast import CastTransform
 from pipeflow.transforms.derive import DeriveTransform
@@ -25,11 +27,25 @@ class TestRenameTransform:
         record = {"name": "Alice"}
         assert t.apply(record) == {"name": "Alice"}
 
+    def test_preserves_key_order_and_copies(self) -> None:
+        t = RenameTransform(mapping={"b": "B"})
+        assert list(t.apply({"a": 1, "b": 2, "c": 3})) == ["a", "B", "c"]
+        record = {"a": 1}
+        result = t.apply(record)
+        assert result == record and result is not record
+
     def test_empty_mapping(self) -> None:
         t = RenameTransform(mapping={})
         record = {"a": 1, "b": 2}
         assert t.apply(record) == {"a": 1, "b": 2}
 
+    def test_copy_false_passes_untouched_records_through(self) -> None:
+        t = RenameTransform(mapping={"a": "b"}, copy=False)
+        record = {"x": 1}
+        assert t.apply(record) is record
+        assert t.apply_batch([record])[0] is record
+        assert t.apply({"a": 1}) == {"b": 1}
+
 
 class TestCastTransform:
     def test_str_to_int(self) -> None:
@@ -59,6 +75,17 @@ class TestCastTransform:
         result = t.apply({"name": "Alice"})
         assert result == {"name": "Alice"}
 
+    def test_unknown_type_rejected_upfront(self) -> None:
+        with pytest.raises(ValueError, match="Unknown cast type: decimal"):
+            CastTransform(columns={"age": "decimal"})
+
+    def test_copy_flag(self) -> None:
+        record = {"age": "25"}
+        assert CastTransform(columns={"age": "int"}).apply(record) is not record
+        assert record["age"] == "25"
+        assert CastTransform(columns={"age": "int"}, copy=False).apply(record) is record
+        assert record["age"] == 25
+
     def test_none_value_skipped(self) -> None:
         t = CastTransform(columns={"age": "int"})
         result = t.apply({"age": None})
@@ -66,6 +93,11 @@ class TestCastTransform:
 
 
 class TestDeriveTransform:
+    def test_undefined_name_in_non_arithmetic_expression(self) -> None:
+        t = DeriveTransform(expression="label = name.upper() + missing")
+        with pytest.raises(ValueError, match="Undefined name: 'missing'"):
+            t.apply({"name": "a"})
+
     def test_simple_concatenation(self) -> None:
         t = DeriveTransform(expression="full_name = first + ' ' + last")
         result = t.apply({"first": "Alice", "last": "Smith"})
@@ -104,6 +136,22 @@ class TestFilterTransform:
         assert t.apply({"city": "LA"}) is not None
         assert t.apply({"city": "NYC"}) is None
 
+    def test_invalid_condition_rejected_upfront(self) -> None:
+        with pytest.raises(ValueError, match="Invalid filter condition"):
+            FilterTransform(condition="__import__('os')")
+
+    def test_undefined_name(self) -> None:
+        t = FilterTransform(condition="missing > 1")
+        with pytest.raises(ValueError, match="Undefined name: 'missing'"):
+            t.apply({"age": 1})
+
+    def test_undefined_name_in_non_arithmetic_condition(self) -> None:
+        t = FilterTransform(condition="missing == 'x' and age > 1")
+        with pytest.raises(ValueError, match="Undefined name: 'missing'"):
+            t.apply({"age": 2})
+        with pytest.raises(ValueError, match="Undefined name: 'missing'"):
+            t.apply_batch([{"age": 2}])
+
     def test_complex_condition(self) -> None:
         t = FilterTransform(condition="age >= 18 and name != 'Bob'")
         assert t.apply({"name": "Alice", "age": 30}) is not None
@@ -129,6 +177,14 @@ class TestDeduplicateTransform:
         assert r2 is not None
         assert r3 is None
 
+    def test_missing_key_treated_as_none(self) -> None:
+        t = DeduplicateTransform(key=["a", "b"])
+        assert t.apply({"a": 1}) is not None
+        assert t.apply({"a": 1, "b": None}) is None
+        single = DeduplicateTransform(key=["a"])
+        assert single.apply({}) is not None
+        assert single.apply({"a": None}) is None
+
     def test_reset(self) -> None:
         t = DeduplicateTransform(key=["id"])
         t.apply({"id": 1})
@@ -136,6 +192,34 @@ class TestDeduplicateTransform:
         result = t.apply({"id": 1})
         assert result is not None
 
+    def test_hashed_keys(self) -> None:
+        t = DeduplicateTransform(key=["first", "last"], hashed=True)
+        records = [
+            {"first": "John", "last": "Doe"},
+            {"first": "John", "last": "Smith"},
+            {"first": "John", "last": "Doe"},
+            {"first": "John"},
+            {"first": "John", "last": None},
+        ]
+        kept = t.apply_batch(records)
+        assert kept == [records[0], records[1], records[3]]
+        assert all(isinstance(k, int) for k in t._seen)
+
+    @pytest.mark.parametrize("hashed", [False, True])
+    def test_numeric_keys_agree_across_modes(self, hashed: bool) -> None:
+        t = DeduplicateTransform(key=["id"], hashed=hashed)
+        kept = [t.apply({"id": v}) is not None for v in (1, 1.0, True, 1.5, "1")]
+        assert kept == [True, False, False, True, True]
+        t = DeduplicateTransform(key=["a", "b"], hashed=hashed)
+        kept = [t.apply({"a": a, "b": b}) is not None for a, b in ((0, 2.0), (False, 2), (0.0, 2))]
+        assert kept == [True, False, False]
+
+    def test_hashed_keys_distinguish_types(self) -> None:
+        t = DeduplicateTransform(key=["id"], hashed=True)
+        assert t.apply({"id": 1}) is not None
+        assert t.apply({"id": "1"}) is not None
+        assert t.apply({"id": 1}) is None
+
 
 class TestTransformChain:
     """Test composing multiple transforms."""
@@ -165,3 +249,47 @@ class TestTransformChain:
         assert len(results) == 2
         assert results[0]["name"] == "Alice"
         assert results[1]["name"] == "Bob"
+
+
+class TestApplyBatch:
+    RECORDS = (
+        {"name": "Alice", "age": "30"},
+        {"name": "Diana", "age": "17"},
+        {"name": "Alice", "age": "30"},
+    )
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda: RenameTransform(mapping={"name": "full_name"}),
+            lambda: CastTransform(columns={"age": "int"}),
+            lambda: FilterTransform(condition="age == '30'"),
+            lambda: DeriveTransform(expression="tag = name + age"),
+            lambda: DeduplicateTransform(key=["name"]),
+        ],
+    )
+    def test_matches_per_record_apply(self, make: Any) -> None:
+        single = make()
+        expected = [r for rec in self.RECORDS if (r := single.apply(dict(rec))) is not None]
+        batch = [dict(rec) for rec in self.RECORDS]
+        assert make().apply_batch(batch) == expected
+
+    def test_build_stages_fuses_per_record_runs(self) -> None:
+        class Tag:
+            def __init__(self, tag: str) -> None:
+                self.tag = tag
+
+            def apply(self, record: dict[str, Any]) -> dict[str, Any] | None:
+                if record["age"] == "17":
+                    return None
+                return {**record, "tags": record.get("tags", "") + self.tag}
+
+        transforms = [Tag("a"), Tag("b"), RenameTransform(mapping={"tags": "t"}), Tag("c")]
+        stages = build_stages(transforms)
+        assert len(stages) == 3
+
+        batch = list(self.RECORDS)
+        for stage in stages:
+            batch = stage(batch)
+        assert [r["t"] for r in batch] == ["ab", "ab"]
+        assert [r["tags"] for r in batch] == ["c", "c"]
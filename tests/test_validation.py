@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from pipeflow.config import ValidateConfig
-from pipeflow.validation.validator import build_validator
+from pipeflow.validation.validator import (
+    build_validator,
+    clear_validator_cache,
+    validator_cache_info,
+)
 
 
 class TestRecordValidator:
@@ -90,3 +94,62 @@ class TestRecordValidator:
         assert "field" in err
         assert "message" in err
         assert "type" in err
+
+    def test_validate_batch_matches_per_record(self) -> None:
+        config = ValidateConfig(
+            model="User",
+            fields={"name": {"type": "str"}, "age": {"type": "int"}},
+        )
+        validator = build_validator(config)
+        records = [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob", "age": "nope"},
+            {"age": 5},
+        ]
+        assert validator.validate_batch(records) == [
+            validator.validate_record(r) for r in records
+        ]
+        assert validator.validate_batch([]) == []
+
+    def test_equal_configs_share_validator(self) -> None:
+        fields = {"name": {"type": "str"}, "age": {"type": "int", "required": False}}
+        first = build_validator(ValidateConfig(model="Cached", fields=fields))
+        again = build_validator(ValidateConfig(model="Cached", fields=dict(reversed(fields.items()))))
+        other = build_validator(ValidateConfig(model="Cached", fields={"name": {"type": "int"}}))
+        assert again is first
+        assert other is not first
+
+    def test_type_checks_skip_pydantic_for_clean_records(self) -> None:
+        config = ValidateConfig(
+            model="Simple",
+            fields={"name": {"type": "str"}, "score": {"type": "float", "required": False}},
+        )
+        validator = build_validator(config)
+        assert validator.checks is not None
+        records = [
+            {"name": "Alice", "score": 1},  # int is fine for float
+            {"name": "Bob", "score": None},
+            {"name": "Cara", "score": "2.5"},  # pydantic coerces, still valid
+            {"name": 5},
+            {"score": 1.0},
+        ]
+        results = validator.validate_batch(records)
+        assert results[:3] == [[], [], []]
+        assert [e["field"] for e in results[3]] == ["name"]
+        assert [e["field"] for e in results[4]] == ["name"]
+        assert results == [validator.validate_record(r) for r in records]
+
+    def test_constrained_specs_use_pydantic_only(self) -> None:
+        config = ValidateConfig(
+            model="Constrained", fields={"name": {"type": "str", "min_length": 1}}
+        )
+        assert build_validator(config).checks is None
+
+    def test_cache_info(self) -> None:
+        clear_validator_cache()
+        config = ValidateConfig(model="Info", fields={"id": {"type": "int"}})
+        build_validator(config)
+        build_validator(config.model_copy())
+        assert validator_cache_info() == (1, 1, 1)
+        clear_validator_cache()
+        assert validator_cache_info() == (0, 0, 0)